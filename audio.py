@@ -0,0 +1,109 @@
+import pygame
+
+FREQUENCY = 44100
+BUFFER_SIZE = 512  # Samples per mixer buffer: smaller means less delay before an effect is heard
+NUM_CHANNELS = 16
+
+# Effects decoded once per mixer session, and the channel reserved for each of them
+_sounds = {}
+_channels = {}
+_volume = 0.5
+_ready = False
+
+
+def configure(buffer_size=BUFFER_SIZE, frequency=FREQUENCY):
+    """Set mixer parameters; takes effect if called before the mixer starts"""
+    pygame.mixer.pre_init(frequency, -16, 2, buffer_size)
+
+
+def init():
+    """Start the mixer once per process; returns False when audio is unavailable"""
+    global _ready
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Error initializing audio: {e}")
+            return False
+    if not _ready:
+        pygame.mixer.set_num_channels(NUM_CHANNELS)
+        _ready = True
+    return True
+
+
+def load_sound(name, path, reserve=True):
+    """Decode an effect into the cache, once. Reserved effects get a channel of their own
+    so they never cut off each other or unreserved sounds."""
+    if name in _sounds:
+        return _sounds[name]
+    if not init():
+        return None
+    try:
+        sound = pygame.mixer.Sound(path)
+    except Exception as e:
+        print(f"Error loading sound {path}: {e}")
+        return None
+    sound.set_volume(_volume)
+    _sounds[name] = sound
+    if reserve:
+        index = len(_channels)
+        pygame.mixer.set_reserved(index + 1)
+        _channels[name] = pygame.mixer.Channel(index)
+    return sound
+
+
+def preload(sound_files, reserve=True):
+    """Decode a {name: path} mapping up front so nothing is loaded mid-game"""
+    for name, path in sound_files.items():
+        load_sound(name, path, reserve)
+
+
+def play(name):
+    """Start an effect without waiting; replaying an effect restarts it on its own channel"""
+    sound = _sounds.get(name)
+    if sound is None or not pygame.mixer.get_init():
+        return
+    channel = _channels.get(name)
+    if channel is not None:
+        channel.play(sound)
+    else:
+        sound.play()
+
+
+def set_volume(volume):
+    """Volume for music and every cached effect"""
+    global _volume
+    _volume = volume
+    if not pygame.mixer.get_init():
+        return
+    pygame.mixer.music.set_volume(volume)
+    for sound in _sounds.values():
+        sound.set_volume(volume)
+
+
+def play_music(path, loops=-1):
+    """Stream background music, looping by default"""
+    if not init():
+        return False
+    try:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(_volume)
+        pygame.mixer.music.play(loops)
+    except pygame.error as e:
+        print(f"Error loading music: {e}")
+        return False
+    return True
+
+
+def stop_music():
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
+
+
+def clear():
+    """Forget cached effects, e.g. before pygame.quit() shuts the mixer down"""
+    global _ready
+    stop_music()
+    _sounds.clear()
+    _channels.clear()
+    _ready = False
@@ -0,0 +1,51 @@
+import random
+from collections import deque
+
+PIECE_IDS = (1, 2, 3, 4, 5, 6, 7)
+
+
+class PieceBag:
+    """Seeded 7-bag piece generator with a lookahead queue.
+
+    Piece ids come lazily from a generator that deals out shuffled bags of
+    all seven pieces; peeking fills the queue only as far as requested."""
+
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.rng_state = self.rng.getstate()  # Only changes when a bag is shuffled
+        self.pending = []  # Rest of the current bag, dealt from the end
+        self.queue = deque()
+        self.ids = self.generate()
+
+    def generate(self):
+        while True:
+            if not self.pending:
+                self.pending = list(PIECE_IDS)
+                self.rng.shuffle(self.pending)
+                self.rng_state = self.rng.getstate()
+            yield self.pending.pop()
+
+    def next_id(self):
+        """Hand out the next piece id"""
+        if self.queue:
+            return self.queue.popleft()
+        return next(self.ids)
+
+    def peek(self, count):
+        """The next ``count`` piece ids without consuming them"""
+        while len(self.queue) < count:
+            self.queue.append(next(self.ids))
+        return list(self.queue)[:count]
+
+    def snapshot(self):
+        """Immutable copy of the bag state"""
+        return (self.rng_state, tuple(self.pending), tuple(self.queue))
+
+    def restore(self, state):
+        rng_state, pending, queue = state
+        if rng_state is not self.rng_state:
+            self.rng.setstate(rng_state)
+            self.rng_state = rng_state
+        self.pending = list(pending)
+        self.queue = deque(queue)
@@ -0,0 +1,200 @@
+import numpy as np
+from game_model import GameModel
+from blocks import IBlock, JBlock, LBlock, OBlock, SBlock, TBlock, ZBlock
+from shapes import ROTATIONS
+
+# Actions understood by BatchEngine.step, one per board
+NOOP, LEFT, RIGHT, ROTATE, DOWN, DROP, GRAVITY = range(7)
+
+NUM_ROWS = 20
+NUM_COLS = 10
+PADDING = 4    # Solid rows kept above and below every board
+WALL_BITS = 4  # Solid columns kept on each side of every row
+
+PLAY_MASK = np.uint32(((1 << NUM_COLS) - 1) << WALL_BITS)
+EMPTY_ROW = np.uint32(0xFFFFFFFF) ^ PLAY_MASK
+SOLID_ROW = np.uint32(0xFFFFFFFF)
+
+
+def _build_tables():
+    """Piece masks, rotation counts and spawn offsets indexed by piece id"""
+    masks = np.zeros((8, 4, 4), dtype=np.uint32)
+    num_rotations = np.ones(8, dtype=np.int64)
+    spawn = np.zeros((8, 2), dtype=np.int64)
+    for block_type in (LBlock, JBlock, IBlock, OBlock, SBlock, TBlock, ZBlock):
+        block = block_type()
+        rotations = ROTATIONS[block.id]
+        num_rotations[block.id] = len(rotations)
+        for state, rotation in enumerate(rotations):
+            masks[block.id, state] = rotation.row_masks
+        spawn[block.id] = (block.row_offset, block.column_offset)
+    return masks, num_rotations, spawn
+
+
+PIECE_MASKS, NUM_ROTATIONS, SPAWN_OFFSETS = _build_tables()
+LINE_SCORES = np.array([GameModel.LINE_SCORES.get(lines, 0) for lines in range(5)], dtype=np.int64)
+LEVEL_THRESHOLDS = np.array(GameModel.LEVEL_THRESHOLDS, dtype=np.int64)
+
+
+class BatchEngine:
+    """Steps N games at once with the GameModel rules.
+
+    Every board is one row of ``boards``: PADDING solid rows, NUM_ROWS
+    playfield rows and PADDING solid rows, each a uint32 bitmask with
+    WALL_BITS solid columns on both sides, so walls, floor and ceiling are
+    ordinary collisions."""
+
+    WALL_KICKS = (0, -1, 1, -2, 2)
+
+    def __init__(self, num_games, seed=None):
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.empty((num_games, NUM_ROWS + 2 * PADDING), dtype=np.uint32)
+        self.bags = np.zeros((num_games, 7), dtype=np.int64)
+        self.bag_index = np.zeros(num_games, dtype=np.int64)
+        self.piece = np.zeros(num_games, dtype=np.int64)
+        self.next_piece = np.zeros(num_games, dtype=np.int64)
+        self.rotation = np.zeros(num_games, dtype=np.int64)
+        self.row = np.zeros(num_games, dtype=np.int64)
+        self.column = np.zeros(num_games, dtype=np.int64)
+        self.score = np.zeros(num_games, dtype=np.int64)
+        self.level = np.ones(num_games, dtype=np.int64)
+        self.lines = np.zeros(num_games, dtype=np.int64)
+        self.pieces = np.zeros(num_games, dtype=np.int64)
+        self.game_over = np.zeros(num_games, dtype=bool)
+        self.reset()
+
+    def reset(self, indices=None):
+        """Start new games on the given boards (all boards by default)"""
+        if indices is None:
+            indices = np.arange(self.num_games)
+        indices = np.asarray(indices)
+        self.boards[indices] = SOLID_ROW
+        self.boards[indices, PADDING:PADDING + NUM_ROWS] = EMPTY_ROW
+        self.bag_index[indices] = 7
+        self.score[indices] = 0
+        self.level[indices] = 1
+        self.lines[indices] = 0
+        self.pieces[indices] = 0
+        self.game_over[indices] = False
+        self.next_piece[indices] = self._draw(indices)
+        self._spawn(indices)
+
+    def board_rows(self, index):
+        """Playfield rows of one board as BitboardGrid-style masks"""
+        rows = (self.boards[index, PADDING:PADDING + NUM_ROWS] & PLAY_MASK) >> np.uint32(WALL_BITS)
+        return [int(mask) for mask in rows]
+
+    def _draw(self, indices):
+        """Next piece id from each board's 7-bag"""
+        empty = indices[self.bag_index[indices] >= 7]
+        if len(empty):
+            self.bags[empty] = self.rng.permuted(np.tile(np.arange(1, 8), (len(empty), 1)), axis=1)
+            self.bag_index[empty] = 0
+        pieces = self.bags[indices, self.bag_index[indices]]
+        self.bag_index[indices] += 1
+        return pieces
+
+    def _spawn(self, indices):
+        """Promote the next piece of each board and flag boards where it does not fit"""
+        self.piece[indices] = self.next_piece[indices]
+        self.next_piece[indices] = self._draw(indices)
+        self.rotation[indices] = 0
+        self.row[indices] = SPAWN_OFFSETS[self.piece[indices], 0]
+        self.column[indices] = SPAWN_OFFSETS[self.piece[indices], 1]
+        fits = self._fits(indices, self.rotation[indices], self.row[indices], self.column[indices])
+        self.game_over[indices] |= ~fits
+
+    def _piece_rows(self, indices, rotation, column):
+        """Masks of the four piece rows, shifted into board coordinates"""
+        masks = PIECE_MASKS[self.piece[indices], rotation]
+        return masks << (column + WALL_BITS).astype(np.uint32)[:, None]
+
+    def _fits(self, indices, rotation, row, column):
+        """Whether each board's piece fits at the given rotation and offset"""
+        row_index = row[:, None] + PADDING + np.arange(4)
+        board_rows = self.boards[indices[:, None], row_index]
+        return ~np.any(board_rows & self._piece_rows(indices, rotation, column), axis=1)
+
+    def step(self, actions):
+        """Apply one action per board; returns the (score, game_over) arrays"""
+        actions = np.asarray(actions)
+        active = ~self.game_over
+        lock = np.zeros(self.num_games, dtype=bool)
+        scored = np.zeros(self.num_games, dtype=bool)
+        soft = active & (actions == DOWN)
+
+        for action, delta in ((LEFT, -1), (RIGHT, 1)):
+            indices = np.flatnonzero(active & (actions == action))
+            if len(indices):
+                moved = self._fits(indices, self.rotation[indices], self.row[indices],
+                                   self.column[indices] + delta)
+                self.column[indices[moved]] += delta
+
+        indices = np.flatnonzero(active & (actions == ROTATE))
+        if len(indices):
+            rotation = (self.rotation[indices] + 1) % NUM_ROTATIONS[self.piece[indices]]
+            pending = np.ones(len(indices), dtype=bool)
+            for kick in self.WALL_KICKS:
+                fits = pending & self._fits(indices, rotation, self.row[indices], self.column[indices] + kick)
+                self.column[indices[fits]] += kick
+                self.rotation[indices[fits]] = rotation[fits]
+                pending &= ~fits
+
+        indices = np.flatnonzero(active & ((actions == DOWN) | (actions == GRAVITY)))
+        if len(indices):
+            fits = self._fits(indices, self.rotation[indices], self.row[indices] + 1, self.column[indices])
+            self.row[indices[fits]] += 1
+            lock[indices[~fits]] = True
+            self.score[soft] += 1
+
+        indices = np.flatnonzero(active & (actions == DROP))
+        if len(indices):
+            distance = np.zeros(len(indices), dtype=np.int64)
+            falling = np.ones(len(indices), dtype=bool)
+            while falling.any():
+                falling &= self._fits(indices, self.rotation[indices], self.row[indices] + distance + 1,
+                                      self.column[indices])
+                distance[falling] += 1
+            self.row[indices] += distance
+            self.score[indices] += 2 * (distance + 1)
+            lock[indices] = True
+            scored[indices] = True
+
+        # Same order as GameModel: a hard drop scores before locking,
+        # a soft drop (controller "down") scores after move_down locked
+        self._update_levels(np.flatnonzero(scored))
+        self._lock(np.flatnonzero(lock))
+        self._update_levels(np.flatnonzero(soft))
+        return self.score, self.game_over
+
+    def _lock(self, indices):
+        """Write pieces into their boards, clear full rows, score and spawn"""
+        if not len(indices):
+            return
+        piece_rows = self._piece_rows(indices, self.rotation[indices], self.column[indices])
+        for i in range(4):
+            self.boards[indices, self.row[indices] + PADDING + i] |= piece_rows[:, i]
+        self.pieces[indices] += 1
+
+        play = self.boards[indices, PADDING:PADDING + NUM_ROWS]
+        full = (play & PLAY_MASK) == PLAY_MASK
+        cleared = full.sum(axis=1)
+        has_clears = cleared > 0
+        if has_clears.any():
+            # Stable sort puts full rows first and keeps the others in order
+            order = np.argsort(~full[has_clears], axis=1, kind="stable")
+            shifted = np.take_along_axis(play[has_clears], order, axis=1)
+            shifted[np.arange(NUM_ROWS) < cleared[has_clears][:, None]] = EMPTY_ROW
+            self.boards[indices[has_clears], PADDING:PADDING + NUM_ROWS] = shifted
+
+        self.score[indices] += LINE_SCORES[cleared] * self.level[indices]
+        self.lines[indices] += cleared
+        self._update_levels(indices[has_clears])
+        self._spawn(indices)
+
+    def _update_levels(self, indices):
+        """GameModel.check_level_up for every board that scored"""
+        if len(indices):
+            reached = np.searchsorted(LEVEL_THRESHOLDS, self.lines[indices], side="right") + 1
+            self.level[indices] = np.maximum(self.level[indices], reached)
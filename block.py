@@ -1,38 +1,49 @@
 from colors import Colors
-import pygame
 from position import Position
+from shapes import ROTATIONS, CELLS
 
 class Block:
+	cell_size = 30
+	colors = Colors.get_cell_colors()
+
 	def __init__(self, id):
 		self.id = id
-		self.cells = {}
-		self.cell_size = 30
+		self.rotations = ROTATIONS[id]
+		self.cells = CELLS[id]
 		self.row_offset = 0
 		self.column_offset = 0
 		self.rotation_state = 0
-		self.colors = Colors.get_cell_colors()
 
 	def move(self, rows, columns):
 		self.row_offset += rows
 		self.column_offset += columns
 
 	def get_cell_positions(self):
-		tiles = self.cells[self.rotation_state]
-		moved_tiles = []
-		for position in tiles:
-			position = Position(position.row + self.row_offset, position.column + self.column_offset)
-			moved_tiles.append(position)
-		return moved_tiles
+		row_offset = self.row_offset
+		column_offset = self.column_offset
+		return [Position(position.row + row_offset, position.column + column_offset)
+			for position in self.rotations[self.rotation_state].cells]
+
+	def get_row_masks(self):
+		return self.rotations[self.rotation_state].row_masks
+
+	def get_column_bottoms(self):
+		return self.rotations[self.rotation_state].column_bottoms
+
+	def get_width(self):
+		return len(self.cells[0])
+
+	def get_height(self):
+		return len(self.cells)
 
 	def rotate(self):
-		self.rotation_state = (self.rotation_state + 1) % len(self.cells)
+		self.rotation_state = (self.rotation_state + 1) % len(self.rotations)
 
 	def undo_rotation(self):
-		self.rotation_state = (self.rotation_state - 1) % len(self.cells)
-
-	def draw(self, screen, offset_x, offset_y):
-		tiles = self.get_cell_positions()
-		for tile in tiles:
-			tile_rect = pygame.Rect(offset_x + tile.column * self.cell_size, 
-				offset_y + tile.row * self.cell_size, self.cell_size -1, self.cell_size -1)
-			pygame.draw.rect(screen, self.colors[self.id], tile_rect)
+		self.rotation_state = (self.rotation_state - 1) % len(self.rotations)
+
+	def draw(self, screen, offset_x, offset_y, atlas=None):
+		from tiles import get_tile_atlas, blit_tiles
+		tile = (atlas if atlas is not None else get_tile_atlas(self.cell_size))[self.id]
+		blit_tiles(screen, [(tile, (offset_x + position.column * self.cell_size, offset_y + position.row * self.cell_size))
+			for position in self.get_cell_positions()])
@@ -1,19 +1,25 @@
-import pymysql
 import hashlib
 from PySide6.QtWidgets import QMessageBox
 
 class Database:
     def __init__(self):
+        # Connected on first use so windows holding a Database open without waiting on MySQL
+        self._conn = None
 
-        self.conn = pymysql.connect(
-            host="localhost",
-            user="root",
-            password="",
-            database="tetris_python",
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        self.create_table()
+    @property
+    def conn(self):
+        if self._conn is None:
+            import pymysql
+            self._conn = pymysql.connect(
+                host="localhost",
+                user="root",
+                password="",
+                database="tetris_python",
+                charset='utf8mb4',
+                cursorclass=pymysql.cursors.DictCursor
+            )
+            self.create_table()
+        return self._conn
 
     def create_table(self):
         with self.conn.cursor() as cursor:
@@ -31,6 +37,7 @@ class Database:
         return hashlib.sha256(password.encode('utf-8')).hexdigest()
 
     def add_user(self, username, password):  # Remove password2 parameter
+        import pymysql
         hashed_password = self.hash_password(password)
 
         try:
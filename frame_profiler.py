@@ -0,0 +1,101 @@
+import csv
+import json
+import time
+from collections import deque
+
+PHASES = ("events", "input", "update", "draw", "flip")
+
+
+class FrameProfiler:
+    """Per-frame timings split into game loop phases, in milliseconds.
+
+    Keeps a rolling window for percentiles and counts frames that went over
+    budget and frames where the loop fell behind and skipped logic time.
+    Each finished frame can also be written to a CSV or JSON-lines sink."""
+
+    def __init__(self, budget_ms=1000 / 60, window=300, sink_path=None):
+        self.budget_ms = budget_ms
+        self.frame_times = deque(maxlen=window)
+        self.phase_times = {phase: deque(maxlen=window) for phase in PHASES}
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.frames = 0
+        self.slow_frames = 0
+        self.dropped_frames = 0
+        self.sink = None
+        self.writer = None
+        if sink_path:
+            self.open_sink(sink_path)
+
+    def open_sink(self, path):
+        """Append every frame to path: CSV for .csv, JSON lines otherwise"""
+        self.close()
+        try:
+            # Appended, so the games of a session (or of several processes) all end up in the log
+            self.sink = open(path, 'a', newline='')
+            if path.endswith(".csv"):
+                self.writer = csv.writer(self.sink)
+                if self.sink.tell() == 0:
+                    self.writer.writerow(["frame", "total", *PHASES, "ticks", "skipped"])
+        except Exception as e:
+            print(f"Error opening profiler sink: {e}")
+            self.sink = None
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+            self.writer = None
+
+    def begin_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to phase"""
+        now = time.perf_counter()
+        self.current[phase] += (now - self.last_mark) * 1000
+        self.last_mark = now
+
+    def end_frame(self, ticks=1, skipped=False):
+        """Close the frame; ticks is the number of logic ticks it ran, skipped whether it fell behind"""
+        total = (time.perf_counter() - self.frame_start) * 1000
+        self.frames += 1
+        self.frame_times.append(total)
+        for phase in PHASES:
+            self.phase_times[phase].append(self.current[phase])
+        if total > self.budget_ms:
+            self.slow_frames += 1
+        if skipped:
+            self.dropped_frames += 1
+
+        if self.sink is not None:
+            if self.writer is not None:
+                self.writer.writerow([self.frames, round(total, 3),
+                                      *(round(self.current[phase], 3) for phase in PHASES), ticks, int(skipped)])
+            else:
+                record = {"frame": self.frames, "total": round(total, 3), "ticks": ticks, "skipped": skipped}
+                record.update((phase, round(self.current[phase], 3)) for phase in PHASES)
+                self.sink.write(json.dumps(record) + "\n")
+
+    def percentiles(self):
+        """Rolling (p50, p95, p99) frame time"""
+        if not self.frame_times:
+            return 0.0, 0.0, 0.0
+        times = sorted(self.frame_times)
+        last = len(times) - 1
+        return tuple(times[min(last, int(last * q))] for q in (0.5, 0.95, 0.99))
+
+    def phase_means(self):
+        return {phase: sum(times) / len(times) if times else 0.0 for phase, times in self.phase_times.items()}
+
+    def hud_lines(self):
+        """Text lines for the on-screen overlay"""
+        p50, p95, p99 = self.percentiles()
+        means = self.phase_means()
+        return [
+            f"frame p50 {p50:.2f} p95 {p95:.2f} p99 {p99:.2f} ms",
+            " ".join(f"{phase} {means[phase]:.2f}" for phase in PHASES),
+            f"slow {self.slow_frames} dropped {self.dropped_frames} / {self.frames}"
+        ]
@@ -8,6 +8,8 @@ import sys
 from grid import Grid
 from blocks import *
 from colors import *
+from text_cache import render_text
+import audio
 
 
 class Game:
@@ -22,14 +24,11 @@ class Game:
         self.fall_speed = {1: 500, 2: 300, 3: 150}  # milliseconds between auto-moves
         self.score_multiplier = {1: 1, 2: 1.5, 3: 2}
         pygame.init()            # Initialise tous les modules Pygame
-        pygame.mixer.init()      # ✅ Initialise le mixer (son)
 
-        # Charge le son maintenant que le mixer est prêt
-        self.rotate_sound = pygame.mixer.Sound("Sounds/rotate.ogg")
-        self.clear_sound = pygame.mixer.Sound("Sounds/clear.ogg")
-
-        pygame.mixer.music.load("Sounds/music.ogg")
-        pygame.mixer.music.play(-1)
+        # Sons décodés une seule fois par le service audio
+        audio.load_sound("rotate", "Sounds/rotate.ogg")
+        audio.load_sound("clear", "Sounds/clear.ogg")
+        audio.play_music("Sounds/music.ogg")
 
 
     def set_level(self, level):
@@ -83,7 +82,7 @@ class Game:
         self.next_block = self.get_random_block()
         rows_cleared = self.grid.clear_full_rows()
         if rows_cleared > 0:
-            self.clear_sound.play()
+            audio.play("clear")
             self.update_score(rows_cleared, 0)
         if self.block_fits() == False:
             self.game_over = True
@@ -107,7 +106,7 @@ class Game:
         if self.block_inside() == False or self.block_fits() == False:
             self.current_block.undo_rotation()
         else:
-            self.rotate_sound.play()
+            audio.play("rotate")
 
     def block_inside(self):
         tiles = self.current_block.get_cell_positions()
@@ -128,10 +127,9 @@ class Game:
             self.next_block.draw(screen, 270, 270)
 
         # Draw level indicator
-        title_font = pygame.font.Font(None, 40)
         level_names = {1: "Easy", 2: "Medium", 3: "Hard"}
         level_text = level_names.get(self.level, "Unknown")
-        level_surface = title_font.render(f"Level: {level_text}", True, Colors.white)
+        level_surface = render_text(f"Level: {level_text}", None, 40, Colors.white)
         screen.blit(level_surface, (365, 400))
 
 
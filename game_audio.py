@@ -0,0 +1,70 @@
+import json
+import os
+import audio
+
+
+class GameAudio:
+    """Plays sound effects and music in response to GameModel events"""
+
+    SOUND_FILES = {
+        'rotate': "Sounds/rotate.ogg",
+        'clear': "Sounds/clear.ogg",
+        # 'drop': "Sounds/drop.ogg",
+        # 'gameover': "Sounds/gameover.ogg"
+    }
+
+    def __init__(self):
+        self.sounds = {}
+        self.load_audio_settings()
+        self.init_audio()
+
+    def load_audio_settings(self):
+        """Load audio settings from config file"""
+        config_path = "settings.json"
+        default_config = {
+            "volume": 0.5,
+            "music_file": "Sounds/music.ogg"
+        }
+
+        try:
+            if os.path.exists(config_path):
+                with open(config_path, 'r') as f:
+                    self.config = json.load(f)
+                    # Ensure all keys exist
+                    for key in default_config:
+                        if key not in self.config:
+                            self.config[key] = default_config[key]
+            else:
+                self.config = default_config
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            self.config = default_config
+
+    def init_audio(self):
+        """Initialize all audio components"""
+        # Effects are decoded once per process by the audio service
+        self.sounds = {name: audio.load_sound(name, path) for name, path in self.SOUND_FILES.items()}
+        self.update_volume(self.config["volume"])
+        self.load_music(self.config["music_file"])
+
+    def load_music(self, music_file):
+        """Load and play background music"""
+        audio.play_music(music_file)
+
+    def update_volume(self, volume):
+        """Update volume for all sounds"""
+        self.config["volume"] = volume
+        audio.set_volume(volume)
+
+    def update_music(self, music_file):
+        """Change background music"""
+        self.config["music_file"] = music_file
+        self.load_music(music_file)
+
+    def play_sound(self, sound_name):
+        """Play specified sound effect"""
+        audio.play(sound_name)
+
+    def on_game_event(self, event, model):
+        """GameModel observer hook: every game event has a matching sound"""
+        self.play_sound(event)
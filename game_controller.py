@@ -1,185 +1,260 @@
 import pygame
 import sys
-import json
+import time
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject, Signal
 from game_model import GameModel
 from game_view import GameView
+from game_audio import GameAudio
+import audio
+from replay import ReplayRecorder, ACTION_CODES
+from frame_profiler import FrameProfiler
+from input_handler import InputHandler
 
 
 class GameController(QObject):
     game_started = Signal()
     game_ended = Signal(int)
     pause_changed = Signal(bool)
+    frame_started = Signal()  # Each pass of game_loop, after the pygame events
 
+    LOGIC_HZ = 60
+    TICK_MS = 1000 / LOGIC_HZ
+    MAX_TICKS_PER_FRAME = 5  # Logic ticks allowed per rendered frame before dropping time
+    IDLE_FPS = 30  # Loop rate while paused or on the game over screen
 
-    def __init__(self, speed, difficulty_name, username):
+    def __init__(self, speed, difficulty_name, username, fps_cap=60, profile_path=None):
         super().__init__()
-        pygame.mixer.init()
-        try:
-            pygame.mixer.music.load("assets/music/game_music.mp3")
-            pygame.mixer.music.set_volume(0.5)
-        except pygame.error:
-            print("Could not load music file")
-
         self.speed = speed
         self.username = username
         self.model = None
         self.view = None
         self.running = False
-        self.key_bindings = self.load_key_bindings()
+        self.input = None
         self.difficulty_name = difficulty_name
         self.GAME_UPDATE = pygame.USEREVENT + 1
+        self.recorder = None
+        self.frame = 0  # Logic ticks since the recording started
+        self.sim_time = 0.0
+        self.skipped = False  # Whether the last advance() fell behind
+        self.fps_cap = fps_cap  # Render frame rate limit, 0 for uncapped
+        self.game_end_reported = False
+        self.owns_view = True
+        # Frame timings; F3 toggles the on-screen overlay, profile_path adds a CSV/JSONL log
+        self.profiler = FrameProfiler(1000 / (fps_cap or self.LOGIC_HZ), sink_path=profile_path)
+        self.show_profiler = False
+
+    def start_game(self, player_name=None, view=None, game_audio=None):
+        """Play until the player leaves; a view passed in (e.g. by a GameSession) is left open"""
+        self.setup_game(player_name, view, game_audio)
+        self.game_loop()
 
-
-
-    def load_key_bindings(self):
-        """Load key bindings from settings.json or fallback to defaults"""
-        default_bindings = {
-            pygame.K_LEFT: "left",
-            pygame.K_RIGHT: "right",
-            pygame.K_UP: "rotate",
-            pygame.K_DOWN: "down",
-            pygame.K_SPACE: "drop",
-            pygame.K_p: "pause",
-            pygame.K_r: "restart"
-        }
-
-        try:
-            with open("settings.json", "r") as f:
-                config = json.load(f)
-                controls = config.get("controls", {})
-
-                return {
-                    pygame.K_LEFT: controls.get("left", "left"),
-                    pygame.K_RIGHT: controls.get("right", "right"),
-                    pygame.K_UP: controls.get("rotate", "rotate"),
-                    pygame.K_DOWN: "down",  # Keep down hardcoded if not customizable
-                    pygame.K_SPACE: controls.get("drop", "drop"),
-                    pygame.K_p: controls.get("pause", "pause"),
-                    pygame.K_r: "restart"
-                }
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-            return default_bindings
-
-    def start_game(self, player_name=None):
+    def setup_game(self, player_name=None, view=None, game_audio=None):
+        """Create the model and recording without entering the loop"""
         name_to_use = player_name if player_name is not None else self.username
         self.model = GameModel(self.difficulty_name, name_to_use)
+        self.model.add_observer(game_audio or GameAudio())
         self.model.base_speed = self.speed
         self.model.current_speed = self.speed
-        self.view = GameView()
+        self.owns_view = view is None
+        self.view = view or GameView()
+        self.view.set_hud(None)
+        # Bindings are resolved to key codes once pygame is up
+        self.input = InputHandler.from_config()
         self.running = True
-        self.game_loop()
+        self.start_recording()
+
+    def start_recording(self):
+        """Start a replay recording for the current game"""
+        self.recorder = ReplayRecorder(self.model.seed, self.difficulty_name, self.model.base_speed)
+        self.frame = 0
+
+    def finish_recording(self):
+        """Save the current replay, once"""
+        if self.recorder is not None:
+            self.recorder.save()
+            self.recorder = None
+
+    def perform(self, action):
+        """Apply an action to the model and record it in the replay"""
+        if self.recorder is not None:
+            self.recorder.record(self.frame, action)
+        if action == "gravity":
+            self.model.move_down()
+        else:
+            self.model.apply_action(action)
+
+    def perform_repeat(self, action, count):
+        """Apply a repeated action count times, or with count 0 until it stops moving the piece"""
+        if count:
+            for _ in range(count):
+                self.perform(action)
+            return
+        for _ in range(self.model.grid.num_cols):
+            column = self.model.current_block.column_offset
+            self.perform(action)
+            if self.model.current_block.column_offset == column:
+                break
 
     def handle_key_press(self, key):
-        self.model.paused = False
-        if key not in self.key_bindings:
+        action = self.input.action_for(key)
+        if action is None:
             return
 
-        action = self.key_bindings[key]
-        print(f"Key pressed: {key}, mapped action: {action}")  # Debug
-
-        if self.model.game_over:
+        if action == "menu":
+            self.running = False
+        elif self.model.game_over:
             if action == "restart":
+                self.finish_recording()
                 self.model.reset()
+                self.start_recording()
+                self.game_end_reported = False
         elif action == "pause":
             self.model.paused = not self.model.paused
+            self.input.release_all()  # Held keys must not burst out on resume
             self.pause_changed.emit(self.model.paused)
-        elif not self.model.paused:
-            if action == "left":
-                self.model.move_left()
-            elif action == "right":
-                self.model.move_right()
-            elif action == "down":
-                self.model.move_down()
-                self.model.update_score(0, 1)
-            elif action == "rotate":
-                self.model.rotate()
-            elif action == "drop":
-                while not self.model.game_over and self.model.block_fits():
-                    self.model.move_down()
-                    self.model.update_score(0, 2)
+        elif not self.model.paused and action in ACTION_CODES:
+            # Only a running game starts holds and latency samples
+            self.perform(self.input.press(action, self.sim_time))
+
+    def toggle_profiler(self):
+        self.show_profiler = not self.show_profiler
+        if not self.show_profiler:
+            self.view.set_hud(None)
+
+    def handle_click(self, mouse_pos):
+        """Pause menu buttons"""
+        if not self.model.paused:
+            return
+        resume_rect, exit_rect = self.view.pause_buttons()
+        if resume_rect.collidepoint(mouse_pos):
+            self.model.paused = False
+            self.pause_changed.emit(False)
+        elif exit_rect.collidepoint(mouse_pos):
+            self.running = False
+
+    def handle_events(self):
+        """Process pending pygame events"""
+        events = pygame.event.get()
+        self.input.events_polled()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.view.invalidate()
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_click(event.pos)
+
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.input.release_all()
+
+            if event.type == pygame.KEYUP:
+                self.input.key_up(event.key, self.sim_time)
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_profiler()
+            elif event.type == pygame.KEYDOWN:
+                self.handle_key_press(event.key)
+
+    def update(self, dt):
+        """Advance the game logic by one fixed tick of dt milliseconds"""
+        self.frame += 1
+        self.sim_time += dt
+        current_time = self.sim_time
+        if self.model.game_over or self.model.paused:
+            # Close both phases anyway so idle ticks are not charged to the draw
+            self.profiler.mark("input")
+            self.profiler.mark("update")
+            return
 
-    def game_loop(self):
-        clock = pygame.time.Clock()
-        last_update = pygame.time.get_ticks()
-        key_repeat_delay = 200
-        key_repeat_interval = 100
-        last_key_press = {}
+        for action, count in self.input.update(current_time):
+            self.perform_repeat(action, count)
+        self.profiler.mark("input")
 
+        if not self.model.game_over and current_time - self.last_update >= self.model.current_speed:
+            self.perform("gravity")
+            self.last_update = current_time
+        self.profiler.mark("update")
+
+    def start_loop(self):
+        """Reset the loop clocks; call before the first advance()"""
+        self.accumulator = 0.0
+        self.sim_time = 0.0
+        self.last_update = 0.0
         self.game_started.emit()
 
+    def advance(self, elapsed_ms):
+        """Run the logic ticks owed for elapsed_ms of wall time; returns how many ran"""
+        self.accumulator += elapsed_ms
+        # Catch up on logic, skipping renders when drawing falls behind
+        ticks = 0
+        while self.accumulator >= self.TICK_MS and ticks < self.MAX_TICKS_PER_FRAME:
+            self.update(self.TICK_MS)
+            self.accumulator -= self.TICK_MS
+            ticks += 1
+        self.skipped = ticks == self.MAX_TICKS_PER_FRAME
+        if self.accumulator >= self.TICK_MS:
+            self.accumulator = 0.0  # Too far behind: drop the backlog rather than spiral
+            self.skipped = True
+        if self.model.paused or self.model.game_over:
+            self.skipped = False  # Idle screens run several ticks a frame on purpose
+        return ticks
+
+    def draw_frame(self, ticks):
+        """Render and present the current state; returns what present() pushed"""
+        profiler = self.profiler
+        if self.show_profiler:
+            latency, worst = self.input.latency_stats()
+            dequeue, _ = self.input.dequeue_stats()
+            self.view.set_hud(profiler.hud_lines() +
+                              [f"input {latency:.2f} max {worst:.2f} dequeued {dequeue:.2f} ms"])
+        self.view.render(self.model)
+        profiler.mark("draw")
+        presented = self.view.present()
+        self.input.presented()
+        profiler.mark("flip")
+        profiler.end_frame(ticks, self.skipped)
+
+        if self.model.game_over and not self.game_end_reported:
+            self.finish_recording()
+            self.game_ended.emit(self.model.score)
+            self.game_end_reported = True
+        return presented
+
+    def end_game(self):
+        """Save the replay and release what this controller owns"""
+        self.running = False
+        self.finish_recording()
+        self.profiler.close()
+        audio.stop_music()
+        if self.owns_view:
+            self.view.close()
+
+    def game_loop(self):
+        """Fixed-rate logic ticks, rendering once per loop at up to fps_cap"""
+        clock = pygame.time.Clock()
+        previous = time.perf_counter()
+        self.start_loop()
+
+        profiler = self.profiler
         while self.running:
-            current_time = pygame.time.get_ticks()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-
-                if event.type == pygame.MOUSEBUTTONDOWN and self.model.paused:
-                    mouse_pos = event.pos
-                    resume_rect, exit_rect = self.view.draw_pause_menu()
-                    if resume_rect.collidepoint(mouse_pos):
-                        self.model.paused = False
-                        self.pause_changed.emit(False)
-                    elif exit_rect.collidepoint(mouse_pos):
-                        self.running = False
-
-                if event.type == pygame.KEYDOWN:
-                    self.handle_key_press(event.key)
-                    last_key_press[event.key] = current_time
-
-
-            if not self.model.game_over and not self.model.paused:
-                keys = pygame.key.get_pressed()
-
-                if keys[pygame.K_LEFT]:
-                    if (pygame.K_LEFT not in last_key_press or
-                            current_time - last_key_press[pygame.K_LEFT] >= key_repeat_delay):
-                        self.model.move_left()
-                        last_key_press[pygame.K_LEFT] = current_time - key_repeat_delay + key_repeat_interval
-
-                if keys[pygame.K_RIGHT]:
-                    if (pygame.K_RIGHT not in last_key_press or
-                            current_time - last_key_press[pygame.K_RIGHT] >= key_repeat_delay):
-                        self.model.move_right()
-                        last_key_press[pygame.K_RIGHT] = current_time - key_repeat_delay + key_repeat_interval
-
-                if keys[pygame.K_DOWN]:
-                    if (pygame.K_DOWN not in last_key_press or
-                            current_time - last_key_press[pygame.K_DOWN] >= key_repeat_delay // 2):
-                        self.model.move_down()
-                        self.model.update_score(0, 1)
-                        last_key_press[pygame.K_DOWN] = current_time - key_repeat_delay + key_repeat_interval // 2
-                if keys[pygame.K_UP]:
-                    if (pygame.K_UP not in last_key_press or
-                            current_time - last_key_press[pygame.K_UP] >= key_repeat_delay):
-                        self.model.rotate()
-                        last_key_press[pygame.K_UP] = current_time - key_repeat_delay + key_repeat_interval
-
-            if not self.model.game_over and not self.model.paused:
-                if current_time - last_update >= self.model.current_speed:
-                    self.model.move_down()
-                    last_update = current_time
-
-            if self.model.paused:
-                resume_rect, exit_rect = self.view.draw(self.model)
-                mouse_pos = pygame.mouse.get_pos()
-                if pygame.mouse.get_pressed()[0]:
-                    if resume_rect and resume_rect.collidepoint(mouse_pos):
-                        self.model.paused = False
-                    elif exit_rect and exit_rect.collidepoint(mouse_pos):
-                        return False
-
-            self.view.draw(self.model)
-
-            if self.model.game_over:
-                self.game_ended.emit(self.model.score)
-
-
-            clock.tick(60)
-
-        self.view.close()
-        pygame.mixer.music.stop()
-        pygame.quit()
+            profiler.begin_frame()
+            now = time.perf_counter()
+            elapsed = (now - previous) * 1000
+            previous = now
+
+            self.handle_events()
+            self.frame_started.emit()
+            profiler.mark("events")
+            ticks = self.advance(elapsed)
+            self.draw_frame(ticks)
+
+            if self.model.paused or self.model.game_over:
+                # Static screens: no need to spin faster than IDLE_FPS
+                clock.tick(min(self.fps_cap or self.IDLE_FPS, self.IDLE_FPS))
+            else:
+                clock.tick(self.fps_cap)
+
+        self.end_game()
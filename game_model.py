@@ -1,14 +1,21 @@
-import random
-import pygame
-import json
-import os
 import datetime
-from grid import Grid
-from game import Game
+from collections import namedtuple
+from grid import BitboardGrid
 from blocks import *
+from bag import PieceBag
+from zobrist import position_key
+from position import Position
+from score_log import score_log
+
+# Immutable copy of everything GameModel.restore needs to resume a game
+GameState = namedtuple("GameState", [
+    "grid", "bag", "block", "next_block_id", "score", "level",
+    "lines_cleared", "pieces_placed", "game_over", "current_speed"
+])
 
 class GameModel:
     LEVEL_THRESHOLDS = [0, 10, 20, 30, 40]  # Lines cleared to reach each level
+    LINE_SCORES = {1: 100, 2: 300, 3: 500, 4: 800}  # Points per lines cleared at once, times level
     # Update these constants
     DIFFICULTY_SPEEDS = {
         "Easy": 800,    # Slowest speed
@@ -19,10 +26,10 @@ class GameModel:
     # Speed decreases by this percentage each level (making the game faster)
     SPEED_DECREMENT = 0.05  # 5% faster each level
 
-    def __init__(self, difficulty="Medium", player_name="Guest", user_id=None):
-        self.game = Game()
-        self.grid = Grid()
-        self.reset_blocks()
+    def __init__(self, difficulty="Medium", player_name="Guest", user_id=None, save_scores=True, seed=None):
+        self.grid = BitboardGrid()
+        self.bag = PieceBag(seed)
+        self.seed = self.bag.seed
         self.current_block = self.get_random_block()
         self.next_block = self.get_random_block()
 
@@ -32,6 +39,7 @@ class GameModel:
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
+        self.pieces_placed = 0
 
         # Player info
         self.player_name = player_name
@@ -43,161 +51,82 @@ class GameModel:
         self.current_speed = self.base_speed
         self.min_speed = 50
 
-        # High scores
-        self.HIGH_SCORES_FILE = "high_scores.json"
-
-        # Initialize audio
-        self.sounds = {}  # Initialize empty sounds dictionary first
-        self.load_audio_settings()
-        self.init_audio()  # This will properly set up all audio components
-
-    def init_audio(self):
-        """Initialize all audio components"""
-        try:
-            pygame.mixer.init()
-
-            # Initialize with silent sounds first to prevent attribute errors
-            silent_sound = pygame.mixer.Sound(buffer=bytearray(44))
-            self.sounds = {
-                'rotate': silent_sound,
-                'drop': silent_sound,
-                'clear': silent_sound,
-                'gameover': silent_sound
-            }
-
-            # Try to load actual sounds
-            try:
-                self.sounds['rotate'] = pygame.mixer.Sound("Sounds/rotate.ogg")
-                self.sounds['clear'] = pygame.mixer.Sound("Sounds/clear.ogg")
-                # Uncomment these if you add the sound files later
-                # self.sounds['drop'] = pygame.mixer.Sound("Sounds/drop.ogg")
-                # self.sounds['gameover'] = pygame.mixer.Sound("Sounds/gameover.ogg")
-            except Exception as e:
-                print(f"Couldn't load some sound files: {e}")
-
-            # Set initial volume
-            self.update_volume(self.config.get("volume", 0.5))
-
-            # Load and play music
-            self.load_music(self.config.get("music_file", "Sounds/music.ogg"))
-
-        except Exception as e:
-            print(f"Error initializing audio: {e}")
-            # Ensure sounds dictionary exists even if initialization fails
-            silent_sound = pygame.mixer.Sound(buffer=bytearray(44))
-            self.sounds = {
-                'rotate': silent_sound,
-                'drop': silent_sound,
-                'clear': silent_sound,
-                'gameover': silent_sound
-            }
-
-    # Remove the duplicate play_sound method and keep only this one:
-    def play_sound(self, sound_name):
-        """Play specified sound effect"""
-        if hasattr(self, 'sounds') and sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except Exception as e:
-                print(f"Error playing sound {sound_name}: {e}")
+        # High scores (simulated games leave them alone)
+        self.save_scores = save_scores
+
+        # Observers notified of game events (audio, rendering, ...)
+        self.observers = []
+
+    def add_observer(self, observer):
+        """Attach an observer whose on_game_event(event, model) gets game events"""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Detach a previously attached observer"""
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def notify(self, event):
+        """Send a game event ('rotate', 'drop', 'clear', 'gameover') to all observers"""
+        for observer in self.observers:
+            observer.on_game_event(event, self)
 
     # Dans GameModel
     def get_difficulty_name(self):
         return self.difficulty_name
 
-    def load_audio_settings(self):
-        """Load audio settings from config file"""
-        config_path = "settings.json"
-        default_config = {
-            "volume": 0.5,
-            "music_file": "Sounds/music.ogg",
-            "controls": {
-                "left": "left",
-                "right": "right",
-                "rotate": "up",
-                "drop": "space",
-                "pause": "p"
-            }
-        }
-
-        try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
-                    # Ensure all keys exist
-                    for key in default_config:
-                        if key not in self.config:
-                            self.config[key] = default_config[key]
-            else:
-                self.config = default_config
-        except Exception as e:
-            print(f"Error loading config: {e}")
-            self.config = default_config
-
-    def init_audio(self):
-        """Initialize all audio components"""
-        try:
-            pygame.mixer.init()
-
-            # Load sound effects
-            self.sounds = {
-                'rotate': pygame.mixer.Sound("Sounds/rotate.ogg"),
-                # 'drop': pygame.mixer.Sound("Sounds/drop.ogg"),
-                'clear': pygame.mixer.Sound("Sounds/clear.ogg"),
-                # 'gameover': pygame.mixer.Sound("Sounds/gameover.ogg")
-            }
-
-            # Set initial volume
-            self.update_volume(self.config["volume"])
-
-            # Load and play music
-            self.load_music(self.config["music_file"])
-
-        except Exception as e:
-            print(f"Error initializing audio: {e}")
-            self.sounds = {}
-
-    def load_music(self, music_file):
-        """Load and play background music"""
-        try:
-            pygame.mixer.music.load(music_file)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-        except Exception as e:
-            print(f"Error loading music: {e}")
-
-    def update_volume(self, volume):
-        """Update volume for all sounds"""
-        self.config["volume"] = volume
-        pygame.mixer.music.set_volume(volume)
-        for sound in self.sounds.values():
-            sound.set_volume(volume)
-
-    def update_music(self, music_file):
-        """Change background music"""
-        self.config["music_file"] = music_file
-        self.load_music(music_file)
-
-    def play_sound(self, sound_name):
-        """Play specified sound effect"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
-
     def update_game_speed(self):
         """Update game speed based on current level"""
         self.current_speed = max(50, self.base_speed - ((self.level - 1) * self.SPEED_DECREMENT))
 
-    def reset(self):
-        """Reset the game to initial state"""
+    def reset(self, seed=None):
+        """Reset the game to initial state, dealing pieces from a new bag"""
         self.grid.reset()
-        self.reset_blocks()
+        self.bag = PieceBag(seed)
+        self.seed = self.bag.seed
         self.current_block = self.get_random_block()
         self.next_block = self.get_random_block()
         self.game_over = False
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
+        self.pieces_placed = 0
         self.update_game_speed()
 
+    def snapshot(self):
+        """Capture the game state; O(rows), shares all immutable parts"""
+        block = self.current_block
+        return GameState(
+            self.grid.snapshot(), self.bag.snapshot(),
+            (block.id, block.rotation_state, block.row_offset, block.column_offset),
+            self.next_block.id, self.score, self.level, self.lines_cleared,
+            self.pieces_placed, self.game_over, self.current_speed
+        )
+
+    def restore(self, state):
+        """Return to a state captured by snapshot()"""
+        self.grid.restore(state.grid)
+        self.bag.restore(state.bag)
+        block_id, rotation_state, row_offset, column_offset = state.block
+        if self.current_block.id != block_id:
+            self.current_block = BLOCK_TYPES[block_id]()
+        block = self.current_block
+        block.rotation_state = rotation_state
+        block.row_offset = row_offset
+        block.column_offset = column_offset
+        if self.next_block.id != state.next_block_id:
+            self.next_block = BLOCK_TYPES[state.next_block_id]()
+        self.score = state.score
+        self.level = state.level
+        self.lines_cleared = state.lines_cleared
+        self.pieces_placed = state.pieces_placed
+        self.game_over = state.game_over
+        self.current_speed = state.current_speed
+
+    def position_key(self):
+        """Transposition key of the board together with the piece to place"""
+        return position_key(self.grid.hash, self.current_block.id)
+
     def check_level_up(self):
         """Check if player should level up based on lines cleared"""
         new_level = 1
@@ -213,43 +142,31 @@ class GameModel:
 
     def update_score(self, lines_cleared, move_down_points=0):
         """Update score based on lines cleared and movement"""
-        line_scores = {
-            1: 100,
-            2: 300,
-            3: 500,
-            4: 800
-        }
-
-        if lines_cleared in line_scores:
-            self.score += line_scores[lines_cleared] * self.level
+        if lines_cleared in self.LINE_SCORES:
+            self.score += self.LINE_SCORES[lines_cleared] * self.level
 
         self.score += move_down_points
         self.lines_cleared += lines_cleared
         self.check_level_up()
 
-    def reset_blocks(self):
-        """Reset the available blocks"""
-        self.blocks = [IBlock(), JBlock(), LBlock(), OBlock(), SBlock(), TBlock(), ZBlock()]
-        return self.blocks
-
     def get_random_block(self):
-        """Get a random block from available blocks"""
-        if len(self.blocks) == 0:
-            self.reset_blocks()
-        block = random.choice(self.blocks)
-        self.blocks.remove(block)
-        return block
+        """Create the next block dealt by the bag"""
+        return BLOCK_TYPES[self.bag.next_id()]()
+
+    def preview(self, count):
+        """Ids of the next ``count`` blocks, starting with next_block"""
+        return [self.next_block.id] + self.bag.peek(count - 1)
 
     def block_fits(self):
         """Check if current block fits in its position"""
-        tiles = self.current_block.get_cell_positions()
-        return all(self.grid.is_empty(tile.row, tile.column) for tile in tiles)
+        block = self.current_block
+        return self.grid.piece_fits(block.get_row_masks(), block.row_offset, block.column_offset)
 
     def rotate(self):
         """Rotate current block if possible"""
         # Save the current rotation state
         original_rotation = self.current_block.rotation_state
-        original_offset = self.current_block.offset.copy()
+        original_offset = (self.current_block.row_offset, self.current_block.column_offset)
 
         # Try rotating
         self.current_block.rotate()
@@ -262,7 +179,7 @@ class GameModel:
             for kick in kicks:
                 self.current_block.move(0, kick)
                 if self.block_inside() and self.block_fits():
-                    self.play_sound('rotate')
+                    self.notify('rotate')
                     return  # Found valid position
 
                 # Undo the kick attempt
@@ -270,14 +187,14 @@ class GameModel:
 
             # If no valid position found, revert rotation
             self.current_block.rotation_state = original_rotation
-            self.current_block.offset = original_offset
+            self.current_block.row_offset, self.current_block.column_offset = original_offset
         else:
-            self.play_sound('rotate')
+            self.notify('rotate')
 
     def block_inside(self):
         """Check if current block is within grid boundaries"""
-        tiles = self.current_block.get_cell_positions()
-        return all(self.grid.is_inside(tile.row, tile.column) for tile in tiles)
+        block = self.current_block
+        return self.grid.piece_inside(block.get_row_masks(), block.row_offset, block.column_offset)
 
     def move_left(self):
         """Move block left if possible"""
@@ -298,52 +215,73 @@ class GameModel:
             self.current_block.move(-1, 0)
             self.lock_block()
         else:
-            self.play_sound('drop')
+            self.notify('drop')
+
+    def apply_action(self, action):
+        """Apply a player action: 'left', 'right', 'down', 'rotate' or 'drop'"""
+        if action == "left":
+            self.move_left()
+        elif action == "right":
+            self.move_right()
+        elif action == "down":
+            self.move_down()
+            self.update_score(0, 1)
+        elif action == "rotate":
+            self.rotate()
+        elif action == "drop":
+            self.hard_drop()
+
+    def drop_distance(self):
+        """Number of rows the current block can fall before landing"""
+        block = self.current_block
+        return self.grid.drop_distance(block.get_row_masks(), block.get_column_bottoms(),
+                                       block.row_offset, block.column_offset)
+
+    def get_ghost_positions(self):
+        """Cells the current block would occupy after a hard drop"""
+        distance = self.drop_distance()
+        return [Position(tile.row + distance, tile.column) for tile in self.current_block.get_cell_positions()]
+
+    def hard_drop(self):
+        """Drop the current block straight to its landing row and lock it"""
+        distance = self.drop_distance()
+        self.current_block.move(distance, 0)
+        self.notify('drop')
+        # Two points per descent step, including the final step that locks the block
+        self.update_score(0, 2 * (distance + 1))
+        self.lock_block()
 
     def lock_block(self):
         """Lock the current block in place and check for completed rows"""
         tiles = self.current_block.get_cell_positions()
         for position in tiles:
-            self.grid.grid[position.row][position.column] = self.current_block.id
+            self.grid.set_cell(position.row, position.column, self.current_block.id)
+        self.pieces_placed += 1
 
         self.current_block = self.next_block
         self.next_block = self.get_random_block()
 
         rows_cleared = self.grid.clear_full_rows()
         if rows_cleared > 0:
-            self.play_sound('clear')
+            self.notify('clear')
             self.update_score(rows_cleared, 0)
 
         if not self.block_fits():
             self.game_over = True
-            self.play_sound('gameover')
-            self.save_score()
+            self.notify('gameover')
+            if self.save_scores:
+                self.save_score()
 
     def save_score(self):
-        """Save the current score to high scores file"""
-        try:
-            if os.path.exists(self.HIGH_SCORES_FILE):
-                with open(self.HIGH_SCORES_FILE, 'r') as f:
-                    scores = json.load(f)
-            else:
-                scores = []
-
-            score_entry = {
-                "player": self.player_name if self.player_name else "Guest",  # Ensure we have a name
-                "score": self.score,
-                "difficulty": self.difficulty_name,
-                "level": self.level,
-                "lines": self.lines_cleared,
-                "timestamp": datetime.datetime.now().isoformat(),
-                "user_id": self.user_id if self.user_id else None  # Include user_id if available
-            }
-
-            scores.append(score_entry)
-            # Sort by score descending, then by timestamp (newer scores first for ties)
-            scores.sort(key=lambda x: (-x["score"], x["timestamp"]))
-            scores = scores[:10]  # Keep only top 10
-
-            with open(self.HIGH_SCORES_FILE, 'w') as f:
-                json.dump(scores, f, indent=4)
-        except Exception as e:
-            print(f"Error saving score: {e}")
\ No newline at end of file
+        """Append the current score to the score log; written in the background"""
+        score_entry = {
+            "player": self.player_name if self.player_name else "Guest",  # Ensure we have a name
+            "score": self.score,
+            "difficulty": self.difficulty_name,
+            "level": self.level,
+            "lines": self.lines_cleared,
+            "seed": self.seed,  # Matches the header of the game's replay
+            "timestamp": datetime.datetime.now().isoformat(),
+            "user_id": self.user_id if self.user_id else None  # Include user_id if available
+        }
+        score_log.append(score_entry)
@@ -0,0 +1,117 @@
+import multiprocessing
+from PySide6.QtCore import QObject, QTimer, Signal
+
+POLL_INTERVAL = 15  # ms between checks for messages from the game process
+QUIT_TIMEOUT = 5  # s to let the game process save and exit before killing it
+
+
+def run_game_process(conn):
+    """Child process entry point: a GameSession playing the games the parent asks for"""
+    import audio
+    from settings import load_config
+    from game_session import GameSession
+
+    audio.configure(load_config().get("audio_buffer", audio.BUFFER_SIZE))
+    session = GameSession()
+    quitting = False
+
+    def check_quit(controller):
+        # The parent may quit mid-game: end the game normally so its replay and score are saved
+        nonlocal quitting
+        if conn.poll() and conn.recv()[0] == "quit":
+            quitting = True
+            controller.running = False
+
+    def connect(controller):
+        controller.game_started.connect(lambda: conn.send(("game_started",)))
+        controller.pause_changed.connect(lambda paused: conn.send(("pause_changed", paused)))
+        controller.game_ended.connect(lambda score: conn.send(("game_ended", score)))
+        controller.frame_started.connect(lambda: check_quit(controller))
+
+    try:
+        while not quitting:
+            message = conn.recv()
+            if message[0] == "play":
+                _, speed, difficulty_name, username, profile_path = message
+                session.play(speed, difficulty_name, username, connect=connect, profile_path=profile_path)
+                if not quitting:
+                    conn.send(("finished",))
+            elif message[0] == "quit":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        session.close()
+
+
+class GameProcess(QObject):
+    """Runs games in a child process so the Qt event loop never blocks.
+
+    The child keeps its game session (window, fonts, sounds) between games.
+    Its controller signals come back over a pipe and are re-emitted here."""
+
+    game_started = Signal()
+    pause_changed = Signal(bool)
+    game_ended = Signal(int)
+    finished = Signal()  # The player left the game and is back to the menu
+
+    def __init__(self, parent=None, profile_path=None):
+        super().__init__(parent)
+        self.profile_path = profile_path  # Frame timings log for its games, None for the settings' one
+        self.process = None
+        self.conn = None
+        self.playing = False
+        self.timer = QTimer(self)
+        self.timer.setInterval(POLL_INTERVAL)
+        self.timer.timeout.connect(self.poll)
+
+    def start_game(self, speed, difficulty_name, username):
+        if self.process is None or not self.process.is_alive():
+            self.start_process()
+        self.conn.send(("play", speed, difficulty_name, username, self.profile_path))
+        self.playing = True
+        self.timer.start()
+
+    def start_process(self):
+        # spawn: a fresh interpreter, never a fork of the Qt application
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=run_game_process, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def poll(self):
+        """Re-emit whatever the game process sent since the last poll"""
+        try:
+            while self.conn.poll():
+                message = self.conn.recv()
+                if message[0] == "game_started":
+                    self.game_started.emit()
+                elif message[0] == "pause_changed":
+                    self.pause_changed.emit(message[1])
+                elif message[0] == "game_ended":
+                    self.game_ended.emit(message[1])
+                elif message[0] == "finished":
+                    self.game_finished()
+        except (EOFError, OSError):
+            # The process died (crash or killed window): treat it as leaving the game
+            self.process = None
+            self.game_finished()
+
+    def game_finished(self):
+        self.playing = False
+        self.timer.stop()
+        self.finished.emit()
+
+    def close(self):
+        """Stop the game process"""
+        self.timer.stop()
+        if self.process is not None and self.process.is_alive():
+            try:
+                self.conn.send(("quit",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(QUIT_TIMEOUT)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.process = None
@@ -0,0 +1,54 @@
+import pygame
+import audio
+from settings import load_config
+from game_view import GameView
+from game_audio import GameAudio
+from game_controller import GameController
+
+
+class GameSession:
+    """The long-lived pygame side of the app.
+
+    The window, fonts, tile atlas and decoded sounds are created for the
+    first game and kept between games: going back to the menu only hides
+    the window, so starting another game costs a state change, not an init."""
+
+    def __init__(self):
+        self.view = None
+        self.game_audio = None
+        self.controller = None
+
+    def play(self, speed, difficulty_name, username, connect=None, profile_path=None):
+        """Run one game in the shared window; returns when the player goes back to the menu.
+
+        connect(controller) is called before the game starts, to hook up its signals.
+        profile_path overrides the frame timings log from the settings."""
+        if self.view is None:
+            self.view = GameView()
+            self.game_audio = GameAudio()
+        else:
+            self.view.show()
+            # Settings may have changed from the menu; sounds stay cached
+            self.game_audio.load_audio_settings()
+            self.game_audio.init_audio()
+        pygame.event.clear()
+
+        config = load_config()
+        self.controller = GameController(speed=speed, difficulty_name=difficulty_name, username=username,
+                                         fps_cap=config.get("fps_cap", 60),
+                                         profile_path=profile_path or config.get("profile_path"))
+        if connect is not None:
+            connect(self.controller)
+        try:
+            self.controller.start_game(view=self.view, game_audio=self.game_audio)
+        finally:
+            self.controller = None
+            audio.stop_music()
+            self.view.hide()
+
+    def close(self):
+        """Shut pygame down, when the application exits"""
+        if self.view is not None:
+            self.view.close()
+            self.view = None
+            self.game_audio = None
@@ -1,61 +1,213 @@
 import pygame
 from colors import Colors
+import text_cache
+from text_cache import get_font, render_text
+import tiles
+import audio
+from tiles import get_tile_atlas, blit_tiles
 
 class GameView:
-    def __init__(self):
+    def __init__(self, bevel=False, offscreen=False):
         pygame.init()
         self.width = 500
         self.height = 620
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Python Tetris")
+        # Offscreen views draw into a plain 32-bit surface and never touch the display
+        self.offscreen = offscreen
+        if offscreen:
+            self.screen = pygame.Surface((self.width, self.height), 0, 32)
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            pygame.display.set_caption("Python Tetris")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 42)
+        self.font = get_font(None, 36)
+        self.title_font = get_font(None, 42)
 
+        # Dimensions et positions
+        self.margin_x = 320
+        self.panel_width = 170
+        spacing = 45
+        self.score_rect = pygame.Rect(self.margin_x, 55, self.panel_width, 60)
+        self.difficulty_rect = pygame.Rect(self.margin_x, self.score_rect.bottom + spacing, self.panel_width, 60)
+        self.next_rect = pygame.Rect(self.margin_x, self.difficulty_rect.bottom + spacing, self.panel_width, 180)
+        self.board_x = 11
+        self.board_y = 11
+        self.cell_size = 30
+        self.tiles = get_tile_atlas(self.cell_size, bevel)
+
+        # Static chrome (panels, titles), rendered once into this surface
+        self.background = None
+        # Pause and game over screens, composited once and reused
+        self.pause_overlay = None
+        self.game_over_overlay = None
+        self.game_over_overlay_key = None
+
+        # Frame profiler overlay: lines of text, drawn over the top of the board
+        self.hud_lines = None
+        self.hud_rect = pygame.Rect(self.board_x, self.board_y, 300, 62)
 
+        # What render() changed and present() still has to push: True for everything
+        self.pending_update = None
+
+        # What the last presented frame showed, to find the regions that changed
+        self.needs_full_redraw = True
+        self.last_overlay = None
+        self.last_grid = None
+        self.last_piece_rows = ()
+        self.last_score = None
+        self.last_next_id = None
+
+        if offscreen:
+            return
         try:
             icon = pygame.image.load("ui/block_tetris.jpg")
             pygame.display.set_icon(icon)
         except:
             print("Could not load window icon")
 
-    def draw(self, model):
-        self.screen.fill(Colors.dark_blue)
+    def show(self):
+        """Bring the window back after hide(); every cache survives"""
+        if not self.offscreen:
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.SHOWN)
+        self.invalidate()
 
-        # Dimensions et positions
-        margin_x = 320
-        width = 170
-        height_score = 60
-        height_next = 180
-        height_difficulty = 60
-        spacing = 45
+    def hide(self):
+        """Hide the window between games without tearing pygame down"""
+        if not self.offscreen:
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.HIDDEN)
+
+    def invalidate(self):
+        """Force the next draw to repaint and present the whole window"""
+        self.needs_full_redraw = True
+
+    def invalidate_background(self):
+        """Rebuild the static background on the next draw (e.g. after a theme change)"""
+        self.background = None
+        self.needs_full_redraw = True
+
+    def _get_background(self):
+        """The cached static background, rebuilt when missing or the window was resized"""
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self.background = self._build_background()
+        return self.background
+
+    def _build_background(self):
+        background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+        background.fill(Colors.dark_blue)
 
-        # Rectangles UI
-        score_rect = pygame.Rect(margin_x, 55, width, height_score)
-        difficulty_rect = pygame.Rect(margin_x, score_rect.bottom + spacing, width, height_difficulty)
-        next_rect = pygame.Rect(margin_x, difficulty_rect.bottom + spacing, width, height_next)
+        margin_x = self.margin_x
+        width = self.panel_width
 
         # Titres avec ombre (placés au-dessus des rectangles)
-        self._draw_text_with_shadow("SCORE", margin_x, score_rect.y - 35, width, 30, Colors.white, self.title_font)
-        self._draw_text_with_shadow("DIFFICULTY", margin_x, difficulty_rect.y - 35, width, 30, Colors.white,
-                                    self.title_font)
-        self._draw_text_with_shadow("NEXT", margin_x, next_rect.y - 35, width, 30, Colors.white, self.title_font)
+        self._draw_text_with_shadow("SCORE", margin_x, self.score_rect.y - 35, width, 30, Colors.white,
+                                    self.title_font, background)
+        self._draw_text_with_shadow("DIFFICULTY", margin_x, self.difficulty_rect.y - 35, width, 30, Colors.white,
+                                    self.title_font, background)
+        self._draw_text_with_shadow("NEXT", margin_x, self.next_rect.y - 35, width, 30, Colors.white,
+                                    self.title_font, background)
 
         # Boîtes avec dégradé
-        self._draw_gradient_rect(score_rect, Colors.light_blue, Colors.dark_blue)
-        self._draw_gradient_rect(difficulty_rect, Colors.light_blue, Colors.dark_blue)
-        self._draw_gradient_rect(next_rect, Colors.light_blue, Colors.dark_blue)
+        for rect in (self.score_rect, self.difficulty_rect, self.next_rect):
+            self._draw_gradient_rect(rect, Colors.light_blue, Colors.dark_blue, background)
+        return background
 
-        self._draw_centered_text(str(model.score), score_rect.x, score_rect.y, width, height_score, Colors.white, 40)
+    def _restore_background(self, rect):
+        """Paint the static background back over a region of the screen"""
+        self.screen.blit(self._get_background(), rect, rect)
 
-        # Difficulté
-        difficulty_name = model.get_difficulty_name() if hasattr(model, 'get_difficulty_name') else "Medium"
-        self._draw_centered_text(difficulty_name, difficulty_rect.x, difficulty_rect.y, width, height_difficulty,
-                                 Colors.white, 35)
+    def draw(self, model):
+        """Draw a frame, presenting only the regions that changed since the last one"""
+        self.render(model)
+        self.present()
 
-        # Grille et blocs
-        model.grid.draw(self.screen)
-        model.current_block.draw(self.screen, 11, 11)
+    def present(self):
+        """Push what the last render() changed to the display.
+
+        Returns it: True for the whole window, a list of rects, or None if nothing changed."""
+        pending = self.pending_update
+        self.pending_update = None
+        if self.offscreen:
+            pass
+        elif pending is True:
+            pygame.display.flip()
+        elif pending:
+            pygame.display.update(pending)
+        return pending
+
+    def render(self, model):
+        """Draw a frame to the screen surface without presenting it"""
+        overlay = (model.game_over, getattr(model, "paused", False))
+        if any(overlay) and overlay == self.last_overlay and not self.needs_full_redraw:
+            return  # Nothing moves under the pause and game over screens
+        if self.needs_full_redraw or overlay != self.last_overlay:
+            self.draw_full(model)
+            self.pending_update = True
+            self.needs_full_redraw = False
+        else:
+            self.pending_update = self.draw_changes(model)
+        self.last_overlay = overlay
+        self.last_grid = [tuple(row) for row in model.grid.grid]
+        self.last_piece_rows = self._piece_rows(model)
+        self.last_score = model.score
+        self.last_next_id = model.next_block.id
+
+    def _piece_rows(self, model):
+        return {tile.row for tile in model.current_block.get_cell_positions()}
+
+    def draw_changes(self, model):
+        """Redraw the board rows, panels and next block that changed; returns their rects"""
+        rects = []
+        grid = model.grid.grid
+        rows = self._piece_rows(model) | set(self.last_piece_rows)
+        rows.update(row for row in range(model.grid.num_rows) if grid[row] != self.last_grid[row])
+        if self.hud_lines:
+            rows.update(range((self.hud_rect.bottom - self.board_y) // self.cell_size + 1))
+        rows = [row for row in rows if 0 <= row < model.grid.num_rows]
+        if rows:
+            for row in rows:
+                rects.append(self._draw_board_row(model, row))
+            model.current_block.draw(self.screen, self.board_x, self.board_y, self.tiles)
+
+        if model.score != self.last_score:
+            rects.append(self._draw_score_panel(model))
+        if model.next_block.id != self.last_next_id:
+            rects.append(self._draw_next_panel(model))
+        if self.hud_lines:
+            rects.append(self._draw_hud())
+        return rects
+
+    def set_hud(self, lines):
+        """Show profiler lines over the board, or hide the overlay with None"""
+        if self.hud_lines and not lines:
+            self.invalidate()
+        self.hud_lines = lines
+
+    def _draw_hud(self):
+        self.screen.fill(Colors.black, self.hud_rect)
+        font = get_font(None, 20)
+        for i, line in enumerate(self.hud_lines):
+            self.screen.blit(font.render(line, True, Colors.green),
+                             (self.hud_rect.x + 4, self.hud_rect.y + 4 + i * 18))
+        return self.hud_rect
+
+    def _draw_board_row(self, model, row):
+        """Repaint one board row from the grid; returns its rect"""
+        row_rect = pygame.Rect(self.board_x, self.board_y + row * self.cell_size,
+                               model.grid.num_cols * self.cell_size, self.cell_size)
+        self._restore_background(row_rect)
+        atlas = self.tiles
+        blit_tiles(self.screen, [(atlas[cell_value], (self.board_x + column * self.cell_size, row_rect.y))
+                                 for column, cell_value in enumerate(model.grid.grid[row])])
+        return row_rect
+
+    def _draw_score_panel(self, model):
+        rect = self.score_rect
+        self._restore_background(rect)
+        self._draw_centered_text(str(model.score), rect.x, rect.y, rect.width, rect.height, Colors.white, 40)
+        return rect
+
+    def _draw_next_panel(self, model):
+        rect = self.next_rect
+        self._restore_background(rect)
 
         # Calculate position for next block - shifted slightly left
         block_size = 30  # Size of each block cell
@@ -63,111 +215,154 @@ class GameView:
         block_height = model.next_block.get_height() * block_size
 
         # Calculate centered position with left adjustment
-        next_block_x = next_rect.x + (next_rect.width - block_width) // 2 - 80
-        next_block_y = next_rect.y + (next_rect.height - block_height) // 2 + 25
+        next_block_x = rect.x + (rect.width - block_width) // 2 - 80
+        next_block_y = rect.y + (rect.height - block_height) // 2 + 25
 
         # Draw the next block
-        model.next_block.draw(self.screen, next_block_x, next_block_y)
+        model.next_block.draw(self.screen, next_block_x, next_block_y, self.tiles)
+        return rect
+
+    def draw_full(self, model):
+        """Repaint the whole window"""
+        self.screen.blit(self._get_background(), (0, 0))
+
+        width = self.panel_width
+        difficulty_rect = self.difficulty_rect
+        self._draw_score_panel(model)
+
+        # Difficulté
+        difficulty_name = model.get_difficulty_name() if hasattr(model, 'get_difficulty_name') else "Medium"
+        self._draw_centered_text(difficulty_name, difficulty_rect.x, difficulty_rect.y, width,
+                                 difficulty_rect.height, Colors.white, 35)
+
+        # Grille et blocs
+        model.grid.draw(self.screen, self.tiles)
+        model.current_block.draw(self.screen, self.board_x, self.board_y, self.tiles)
+        self._draw_next_panel(model)
 
         # Game over message - adjusted to fit container better
         if model.game_over:
-            # Create a semi-transparent overlay
-            overlay = pygame.Surface((500, 620), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))  # Dark semi-transparent
-            self.screen.blit(overlay, (0, 0))
-
-            # Game over window dimensions
-            window_width, window_height = 350, 200
-            window_x = (500 - window_width) // 2
-            window_y = (620 - window_height) // 2
-
-            # Draw window background
-            pygame.draw.rect(self.screen, (30, 40, 60),
-                             (window_x, window_y, window_width, window_height),
-                             border_radius=20)
-            pygame.draw.rect(self.screen, (80, 100, 150),
-                             (window_x, window_y, window_width, window_height),
-                             3, border_radius=20)
-
-            # Game Over title
-            title = self.title_font.render("GAME OVER", True, Colors.red)
-            self.screen.blit(title,
-                             (window_x + (window_width - title.get_width()) // 2,
-                              window_y + 30))
-
-            # Score display
-            score_text = self.font.render(f"Final Score: {model.score}", True, Colors.white)
-            self.screen.blit(score_text,
-                             (window_x + (window_width - score_text.get_width()) // 2,
-                              window_y + 80))
-
-            # Restart instruction
-            restart_text = self.font.render("Press R to restart", True, Colors.white)
-            self.screen.blit(restart_text,
-                             (window_x + (window_width - restart_text.get_width()) // 2,
-                              window_y + 120))
+            self.screen.blit(self._get_game_over_overlay(model.score), (0, 0))
         # Menu pause
         if getattr(model, "paused", False):
             self.draw_pause_menu()
+        if self.hud_lines:
+            self._draw_hud()
+
+    def _get_game_over_overlay(self, score):
+        """Game over screen composited once per final score"""
+        key = (score, self.screen.get_size())
+        if self.game_over_overlay is None or self.game_over_overlay_key != key:
+            self.game_over_overlay = self._build_game_over_overlay(score)
+            self.game_over_overlay_key = key
+        return self.game_over_overlay
+
+    def _build_game_over_overlay(self, score):
+        # Create a semi-transparent overlay
+        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))  # Dark semi-transparent
 
-        pygame.display.flip()
-        self.clock.tick(60)
+        # Game over window dimensions
+        window_width, window_height = 350, 200
+        window_x = (500 - window_width) // 2
+        window_y = (620 - window_height) // 2
+
+        # Draw window background
+        pygame.draw.rect(overlay, (30, 40, 60),
+                         (window_x, window_y, window_width, window_height),
+                         border_radius=20)
+        pygame.draw.rect(overlay, (80, 100, 150),
+                         (window_x, window_y, window_width, window_height),
+                         3, border_radius=20)
+
+        # Game Over title
+        title = render_text("GAME OVER", None, 42, Colors.red)
+        overlay.blit(title,
+                     (window_x + (window_width - title.get_width()) // 2,
+                      window_y + 30))
+
+        # Score display
+        score_text = render_text(f"Final Score: {score}", None, 36, Colors.white)
+        overlay.blit(score_text,
+                     (window_x + (window_width - score_text.get_width()) // 2,
+                      window_y + 80))
+
+        # Restart instruction
+        restart_text = render_text("Press R to restart", None, 36, Colors.white)
+        overlay.blit(restart_text,
+                     (window_x + (window_width - restart_text.get_width()) // 2,
+                      window_y + 120))
+        return overlay
 
     def _draw_centered_text(self, text, x, y, width, height, color, font_size):
-        font = pygame.font.Font(None, font_size)
-        surface = font.render(str(text), True, color)
+        surface = render_text(str(text), None, font_size, color)
         rect = surface.get_rect(center=(x + width // 2, y + height // 2))
         self.screen.blit(surface, rect)
 
-    def _draw_text_with_shadow(self, text, x, y, width, height, color, font=None):
+    def _draw_text_with_shadow(self, text, x, y, width, height, color, font=None, surface=None):
         font = font or self.font
+        if surface is None:
+            surface = self.screen
         # Ombre
         shadow = font.render(text, True, Colors.black)
         shadow_rect = shadow.get_rect(center=(x + width // 2 + 2, y + height // 2 + 2))
-        self.screen.blit(shadow, shadow_rect)
+        surface.blit(shadow, shadow_rect)
         # Texte principal
         text_surf = font.render(text, True, color)
         text_rect = text_surf.get_rect(center=(x + width // 2, y + height // 2))
-        self.screen.blit(text_surf, text_rect)
+        surface.blit(text_surf, text_rect)
 
-    def _draw_gradient_rect(self, rect, color1, color2):
+    def _draw_gradient_rect(self, rect, color1, color2, surface=None):
         """Dessine un rectangle avec dégradé"""
+        if surface is None:
+            surface = self.screen
         for y in range(rect.top, rect.bottom):
             ratio = (y - rect.top) / rect.height
             r = int(color1[0] + (color2[0] - color1[0]) * ratio)
             g = int(color1[1] + (color2[1] - color1[1]) * ratio)
             b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (rect.left, y), (rect.right, y))
-        pygame.draw.rect(self.screen, Colors.white, rect, 2, border_radius=10)
+            pygame.draw.line(surface, (r, g, b), (rect.left, y), (rect.right, y))
+        pygame.draw.rect(surface, Colors.white, rect, 2, border_radius=10)
+
+    def pause_buttons(self):
+        """Rects of the pause menu's Resume and Exit buttons"""
+        resume_button = pygame.Rect(self.width // 2 - 100, self.height // 2 + 20, 200, 50)
+        exit_button = pygame.Rect(self.width // 2 - 100, self.height // 2 + 90, 200, 50)
+        return resume_button, exit_button
 
     def draw_pause_menu(self):
+        if self.pause_overlay is None or self.pause_overlay.get_size() != self.screen.get_size():
+            self.pause_overlay = self._build_pause_overlay()
+        self.screen.blit(self.pause_overlay, (0, 0))
+        return self.pause_buttons()
+
+    def _build_pause_overlay(self):
         # Create a semi-transparent overlay
         overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
 
         # Draw pause text
-        font = pygame.font.SysFont('Arial', 50)
-        text = font.render('PAUSED', True, (255, 255, 255))
+        text = render_text('PAUSED', 'Arial', 50, (255, 255, 255), system=True)
         text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 50))
-        self.screen.blit(text, text_rect)
+        overlay.blit(text, text_rect)
 
         # Draw buttons
-        resume_button = pygame.Rect(self.width // 2 - 100, self.height // 2 + 20, 200, 50)
-        exit_button = pygame.Rect(self.width // 2 - 100, self.height // 2 + 90, 200, 50)
+        resume_button, exit_button = self.pause_buttons()
 
-        pygame.draw.rect(self.screen, (0, 200, 0), resume_button)
-        pygame.draw.rect(self.screen, (200, 0, 0), exit_button)
+        pygame.draw.rect(overlay, (0, 200, 0), resume_button)
+        pygame.draw.rect(overlay, (200, 0, 0), exit_button)
 
-        font = pygame.font.SysFont('Arial', 30)
-        resume_text = font.render('Resume', True, (0, 0, 0))
-        exit_text = font.render('Exit', True, (0, 0, 0))
+        resume_text = render_text('Resume', 'Arial', 30, (0, 0, 0), system=True)
+        exit_text = render_text('Exit', 'Arial', 30, (0, 0, 0), system=True)
 
-        self.screen.blit(resume_text, (resume_button.centerx - resume_text.get_width() // 2,
-                                       resume_button.centery - resume_text.get_height() // 2))
-        self.screen.blit(exit_text, (exit_button.centerx - exit_text.get_width() // 2,
-                                     exit_button.centery - exit_text.get_height() // 2))
+        overlay.blit(resume_text, (resume_button.centerx - resume_text.get_width() // 2,
+                                   resume_button.centery - resume_text.get_height() // 2))
+        overlay.blit(exit_text, (exit_button.centerx - exit_text.get_width() // 2,
+                                 exit_button.centery - exit_text.get_height() // 2))
+        return overlay
 
-        return resume_button, exit_button
     def close(self):
+        text_cache.clear()
+        tiles.clear()
+        audio.clear()
         pygame.quit()
\ No newline at end of file
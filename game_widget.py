@@ -0,0 +1,149 @@
+import time
+import pygame
+import audio
+from settings import load_config
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QImage, QPainter, QKeySequence
+from PySide6.QtCore import Qt, QTimer, Signal
+from game_view import GameView
+from game_controller import GameController
+
+# Masks of a surface whose memory already is a QImage.Format_RGB32 buffer (0xffRRGGBB)
+RGB32_MASKS = (0xFF0000, 0xFF00, 0xFF)
+
+# Qt key names that SDL spells differently
+QT_KEY_NAMES = {"Esc": "escape", "Del": "delete", "Ins": "insert", "PgUp": "pageup", "PgDown": "pagedown"}
+
+
+def to_pygame_key(qt_key):
+    """The pygame key code for a Qt key, or None"""
+    name = QKeySequence(qt_key).toString()
+    try:
+        return pygame.key.key_code(QT_KEY_NAMES.get(name, name))
+    except ValueError:
+        return None
+
+
+class GameWidget(QWidget):
+    """Hosts a game inside a Qt window.
+
+    GameView draws into an offscreen pygame surface; paintEvent wraps that
+    surface's memory in a QImage instead of copying it, and a QTimer drives
+    the controller one frame at a time instead of its blocking loop."""
+
+    finished = Signal()  # The player left the game
+
+    def __init__(self, speed, difficulty_name, username, fps_cap=None, profile_path=None, parent=None):
+        super().__init__(parent)
+        config = load_config()
+        if fps_cap is None:
+            fps_cap = config.get("fps_cap", 60)
+        profile_path = profile_path or config.get("profile_path")
+        # Mixer parameters must be set before GameView starts pygame
+        audio.configure(config.get("audio_buffer", audio.BUFFER_SIZE))
+        self.view = GameView(offscreen=True)
+        self.setFixedSize(self.view.width, self.view.height)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)  # Every pixel comes from the surface
+
+        self.controller = GameController(speed=speed, difficulty_name=difficulty_name, username=username,
+                                         fps_cap=fps_cap, profile_path=profile_path)
+        # Signals of the running game, for the surrounding UI
+        self.game_started = self.controller.game_started
+        self.pause_changed = self.controller.pause_changed
+        self.game_ended = self.controller.game_ended
+
+        surface = self.view.screen
+        self.shared_buffer = surface.get_bitsize() == 32 and surface.get_masks()[:3] == RGB32_MASKS
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.interval = round(1000 / (fps_cap or GameController.LOGIC_HZ))
+        # Static screens: no need to tick faster than IDLE_FPS, as in game_loop
+        self.idle_interval = max(self.interval, round(1000 / GameController.IDLE_FPS))
+        self.timer.setInterval(self.interval)
+        self.timer.timeout.connect(self.tick)
+        self.previous = 0.0
+
+    def start(self, player_name=None, game_audio=None):
+        self.controller.setup_game(player_name, self.view, game_audio)
+        self.controller.start_loop()
+        self.previous = time.perf_counter()
+        self.update()
+        self.timer.start()
+        self.setFocus()
+
+    def stop(self):
+        """End the game and release its view; the widget hosts a single game"""
+        if self.timer.isActive():
+            self.timer.stop()
+            self.controller.end_game()
+            self.view.close()  # Passed in, so end_game leaves it open
+            self.finished.emit()
+
+    def tick(self):
+        """One frame: logic ticks owed since the last one, then repaint what changed"""
+        controller = self.controller
+        controller.profiler.begin_frame()
+        now = time.perf_counter()
+        elapsed = (now - self.previous) * 1000
+        self.previous = now
+        controller.profiler.mark("events")
+
+        changed = controller.draw_frame(controller.advance(elapsed))
+        if changed is True:
+            self.update()
+        elif changed:
+            for rect in changed:
+                self.update(rect.x, rect.y, rect.width, rect.height)
+
+        if not controller.running:
+            self.stop()
+            return
+        model = controller.model
+        interval = self.idle_interval if model.paused or model.game_over else self.interval
+        if self.timer.interval() != interval:
+            self.timer.setInterval(interval)
+
+    def paintEvent(self, event):
+        surface = self.view.screen
+        painter = QPainter(self)
+        if self.shared_buffer:
+            # Locks the surface only while painting; rendering happens between paints
+            buffer = surface.get_buffer()
+            image = QImage(buffer, surface.get_width(), surface.get_height(), surface.get_pitch(),
+                           QImage.Format_RGB32)
+        else:
+            image = QImage(pygame.image.tobytes(surface, "RGBX"), surface.get_width(), surface.get_height(),
+                           QImage.Format_RGBX8888)
+        painter.drawImage(event.rect(), image, event.rect())
+        painter.end()
+
+    def keyPressEvent(self, event):
+        if event.isAutoRepeat() or not self.timer.isActive():
+            return  # Held keys repeat through the input handler's DAS/ARR
+        key = to_pygame_key(event.key())
+        if key == pygame.K_F3:
+            self.controller.toggle_profiler()
+        elif key is not None:
+            self.controller.handle_key_press(key)
+
+    def keyReleaseEvent(self, event):
+        if event.isAutoRepeat() or not self.timer.isActive():
+            return
+        key = to_pygame_key(event.key())
+        if key is not None:
+            self.controller.input.key_up(key, self.controller.sim_time)
+
+    def focusOutEvent(self, event):
+        if self.controller.input is not None:
+            self.controller.input.release_all()
+        super().focusOutEvent(event)
+
+    def mousePressEvent(self, event):
+        if self.timer.isActive():
+            position = event.position()
+            self.controller.handle_click((int(position.x()), int(position.y())))
+
+    def closeEvent(self, event):
+        self.stop()
+        super().closeEvent(event)
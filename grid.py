@@ -1,5 +1,5 @@
-import pygame
 from colors import Colors
+from zobrist import CELL_KEYS, row_hash
 
 class Grid:
 	def __init__(self):
@@ -8,6 +8,10 @@ class Grid:
 		self.cell_size = 30
 		self.grid = [[0 for j in range(self.num_cols)] for i in range(self.num_rows)]
 		self.colors = Colors.get_cell_colors()
+		# Screen position of every cell and a reusable (tile, position) list for drawing
+		self.tile_positions = [(column*self.cell_size + 11, row*self.cell_size + 11)
+			for row in range(self.num_rows) for column in range(self.num_cols)]
+		self.tile_blits = [None] * len(self.tile_positions)
 
 	def print_grid(self):
 		for row in range(self.num_rows):
@@ -20,6 +24,9 @@ class Grid:
 			return True
 		return False
 
+	def set_cell(self, row, column, value):
+		self.grid[row][column] = value
+
 	def is_empty(self, row, column):
 		if self.grid[row][column] == 0:
 			return True
@@ -55,10 +62,160 @@ class Grid:
 			for column in range(self.num_cols):
 				self.grid[row][column] = 0
 
-	def draw(self, screen):
+	def draw(self, screen, atlas=None):
+		from tiles import get_tile_atlas, blit_tiles
+		tiles = atlas if atlas is not None else get_tile_atlas(self.cell_size)
+		blits = self.tile_blits
+		positions = self.tile_positions
+		index = 0
 		for row in range(self.num_rows):
-			for column in range(self.num_cols):
-				cell_value = self.grid[row][column]
-				cell_rect = pygame.Rect(column*self.cell_size + 11, row*self.cell_size + 11,
-				self.cell_size -1, self.cell_size -1)
-				pygame.draw.rect(screen, self.colors[cell_value], cell_rect)
+			for cell_value in self.grid[row]:
+				blits[index] = (tiles[cell_value], positions[index])
+				index += 1
+		blit_tiles(screen, blits)
+
+class BitboardGrid(Grid):
+	"""Grid storing each row as an integer bitmask (bit c = column c).
+
+	The inherited ``grid`` list keeps the color ids of every row for drawing,
+	as tuples so snapshots can share them, while ``rows`` holds the occupancy masks used by the game rules and
+	``column_tops`` the row of the highest filled cell of every column
+	(``num_rows`` for an empty column). ``hash`` is a Zobrist hash of the
+	occupancy, updated incrementally on cell writes and line clears."""
+	def __init__(self):
+		super().__init__()
+		self.full_mask = (1 << self.num_cols) - 1
+		self.empty_row = (0,) * self.num_cols
+		self.reset()
+
+	def set_cell(self, row, column, value):
+		colors = self.grid[row]
+		self.grid[row] = colors[:column] + (value,) + colors[column + 1:]
+		was_filled = (self.rows[row] >> column) & 1
+		if value:
+			self.rows[row] |= 1 << column
+			if row < self.column_tops[column]:
+				self.column_tops[column] = row
+		else:
+			self.rows[row] &= ~(1 << column)
+			# Only clearing a column's top cell can lower its surface
+			if was_filled and row == self.column_tops[column]:
+				self.update_column_tops()
+		if was_filled != bool(value):
+			self.board_hash ^= CELL_KEYS[row][column]
+
+	def update_column_tops(self):
+		"""Recompute every column surface from the row masks"""
+		tops = [self.num_rows] * self.num_cols
+		pending = self.full_mask
+		for row, mask in enumerate(self.rows):
+			found = mask & pending
+			while found:
+				bit = found & -found
+				tops[bit.bit_length() - 1] = row
+				found ^= bit
+			pending &= ~mask
+			if not pending:
+				break
+		self.column_tops = tops
+
+	@property
+	def hash(self):
+		return self.board_hash
+
+	def update_hash(self):
+		"""Recompute the Zobrist hash from the row masks"""
+		board_hash = 0
+		for row, mask in enumerate(self.rows):
+			board_hash ^= row_hash(row, mask)
+		self.board_hash = board_hash
+
+	def is_empty(self, row, column):
+		return not (self.rows[row] >> column) & 1
+
+	def is_row_full(self, row):
+		return self.rows[row] == self.full_mask
+
+	def clear_row(self, row):
+		self.rows[row] = 0
+		self.grid[row] = self.empty_row
+		self.update_column_tops()
+		self.update_hash()
+
+	def move_row_down(self, row, num_rows):
+		self.rows[row+num_rows] = self.rows[row]
+		self.grid[row+num_rows] = self.grid[row]
+		self.rows[row] = 0
+		self.grid[row] = self.empty_row
+		self.update_column_tops()
+		self.update_hash()
+
+	def clear_full_rows(self):
+		kept = [row for row in range(self.num_rows) if self.rows[row] != self.full_mask]
+		completed = self.num_rows - len(kept)
+		if completed > 0:
+			old_rows = self.rows
+			self.rows = [0] * completed + [old_rows[row] for row in kept]
+			self.grid = [self.empty_row] * completed + [self.grid[row] for row in kept]
+			self.update_column_tops()
+			# Only rows above the lowest cleared row shifted
+			lowest = max(row for row in range(self.num_rows) if old_rows[row] == self.full_mask)
+			for row in range(lowest + 1):
+				self.board_hash ^= row_hash(row, old_rows[row]) ^ row_hash(row, self.rows[row])
+		return completed
+
+	def reset(self):
+		self.rows = [0] * self.num_rows
+		self.column_tops = [self.num_rows] * self.num_cols
+		self.grid = [self.empty_row] * self.num_rows
+		self.board_hash = 0
+
+	def snapshot(self):
+		"""Immutable copy of the board; color rows are shared, not copied"""
+		return (tuple(self.rows), tuple(self.grid), tuple(self.column_tops), self.board_hash)
+
+	def restore(self, state):
+		rows, grid, column_tops, self.board_hash = state
+		self.rows = list(rows)
+		self.grid = list(grid)
+		self.column_tops = list(column_tops)
+
+	def piece_inside(self, row_masks, row, column):
+		"""Check that a piece given as per-row masks at (row, column) is on the board"""
+		for i, mask in enumerate(row_masks):
+			if not mask:
+				continue
+			if row + i < 0 or row + i >= self.num_rows:
+				return False
+			if column < 0:
+				if mask & ((1 << -column) - 1):
+					return False
+			elif (mask << column) & ~self.full_mask:
+				return False
+		return True
+
+	def piece_fits(self, row_masks, row, column):
+		"""Check that a piece given as per-row masks at (row, column) overlaps no filled cell"""
+		rows = self.rows
+		for i, mask in enumerate(row_masks):
+			if mask and rows[row + i] & (mask << column if column >= 0 else mask >> -column):
+				return False
+		return True
+
+	def drop_distance(self, row_masks, column_bottoms, row, column):
+		"""Number of rows a piece at (row, column) can fall before it lands.
+
+		Uses the column surfaces directly; only a piece already tucked below a
+		surface (under an overhang) falls back to testing row by row."""
+		distance = self.num_rows
+		for piece_column, bottom in column_bottoms:
+			gap = self.column_tops[column + piece_column] - (row + bottom) - 1
+			if gap < 0:
+				distance = 0
+				while self.piece_inside(row_masks, row + distance + 1, column) and \
+						self.piece_fits(row_masks, row + distance + 1, column):
+					distance += 1
+				return distance
+			if gap < distance:
+				distance = gap
+		return distance
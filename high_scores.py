@@ -7,8 +7,7 @@ from PySide6.QtWidgets import (
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QColor
-
-HIGH_SCORES_FILE = "high_scores.json"
+from score_log import score_log, HIGH_SCORES_FILE
 
 
 class HighScoresWindow(QWidget):
@@ -138,9 +137,7 @@ class HighScoresWindow(QWidget):
 
     def reset_scores(self):
         self.scores = []
-        try:
-            with open(HIGH_SCORES_FILE, 'w') as f:
-                json.dump([], f)
-            self.display_scores()
-        except Exception as e:
-            print(f"Error resetting scores: {e}")
\ No newline at end of file
+        # Recorded in the score log, which rewrites the index; the history is kept
+        score_log.reset()
+        score_log.flush()
+        self.display_scores()
\ No newline at end of file
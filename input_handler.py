@@ -0,0 +1,160 @@
+import json
+import os
+import time
+from collections import deque
+import pygame
+
+DEFAULT_CONTROLS = {
+    "left": "left",
+    "right": "right",
+    "rotate": "up",
+    "down": "down",
+    "drop": "space",
+    "pause": "p",
+    "restart": "r",
+    "menu": "escape"
+}
+DEFAULT_DAS = 200  # ms a move key is held before it starts repeating
+DEFAULT_ARR = 100  # ms between repeats, 0 to slide straight to the wall
+DEFAULT_SOFT_DROP = 50  # ms between soft drop steps while down is held
+
+SHIFT_ACTIONS = ("left", "right")
+
+
+def load_input_config(config_path="settings.json"):
+    """Controls and repeat timings from the config file, with defaults for anything missing"""
+    config = {"controls": dict(DEFAULT_CONTROLS), "das": DEFAULT_DAS, "arr": DEFAULT_ARR,
+              "soft_drop": DEFAULT_SOFT_DROP}
+    try:
+        if os.path.exists(config_path):
+            with open(config_path, 'r') as f:
+                saved = json.load(f)
+            config["controls"].update(saved.get("controls", {}))
+            for key in ("das", "arr", "soft_drop"):
+                if key in saved:
+                    config[key] = saved[key]
+    except Exception as e:
+        print(f"Error loading input settings: {e}")
+    return config
+
+
+class InputHandler:
+    """Turns timestamped key presses and releases into game actions.
+
+    The first move happens on the press itself; held moves then repeat with
+    delayed auto-shift (das) and auto-repeat rate (arr), advanced by update()
+    on the logic tick. Works at the action level too, through press() and
+    release(), so other front ends can feed it without pygame key codes."""
+
+    def __init__(self, controls=None, das=DEFAULT_DAS, arr=DEFAULT_ARR, soft_drop=DEFAULT_SOFT_DROP):
+        self.das = das
+        self.arr = arr
+        self.soft_drop = soft_drop
+        self.key_actions = {}
+        self.set_controls(controls or DEFAULT_CONTROLS)
+        self.held = {}  # action -> time of its next repeat
+        self.shift_order = []  # held left/right, most recent last
+        # Input-to-move latency: (arrived by, dequeued at) of presses waiting for their move to be shown
+        self.pending = deque()
+        self.latencies = deque(maxlen=300)
+        self.dequeue_latencies = deque(maxlen=300)
+        self.last_poll = None  # When the event queue was last emptied
+        self.arrived_after = None  # Earliest arrival of the keys in the current batch
+
+    @classmethod
+    def from_config(cls, config_path="settings.json"):
+        config = load_input_config(config_path)
+        return cls(config["controls"], config["das"], config["arr"], config["soft_drop"])
+
+    def set_controls(self, controls):
+        """Map action -> key name bindings (as saved in settings.json) to key codes"""
+        self.key_actions = {}
+        for action, name in controls.items():
+            try:
+                self.key_actions[pygame.key.key_code(name)] = action
+            except ValueError:
+                print(f"Unknown key '{name}' for {action}")
+
+    def action_for(self, key):
+        """The action bound to a key code, or None"""
+        return self.key_actions.get(key)
+
+    def key_up(self, key, now):
+        action = self.key_actions.get(key)
+        if action is not None:
+            self.release(action, now)
+
+    def events_polled(self):
+        """Call right after taking events off the queue: their keys arrived after the previous poll"""
+        self.arrived_after = self.last_poll
+        self.last_poll = time.perf_counter()
+
+    def press(self, action, now):
+        """Start holding an action at logic time now (ms); returns it for the immediate move"""
+        dequeued = time.perf_counter()
+        # The key may have waited in the queue since the previous poll, e.g. through clock.tick
+        self.pending.append((self.arrived_after or dequeued, dequeued))
+        if action in SHIFT_ACTIONS:
+            if action in self.shift_order:
+                self.shift_order.remove(action)
+            self.shift_order.append(action)
+            self.held[action] = now + self.das
+        elif action == "down":
+            self.held[action] = now + self.soft_drop
+        return action
+
+    def release(self, action, now):
+        self.held.pop(action, None)
+        if action in self.shift_order:
+            self.shift_order.remove(action)
+            if self.shift_order:
+                # The other direction is still held: it charges its delay again from here
+                self.held[self.shift_order[-1]] = now + self.das
+
+    def release_all(self):
+        """Drop every held action, e.g. when the window loses focus"""
+        self.held.clear()
+        self.shift_order.clear()
+
+    def update(self, now):
+        """Repeats due at logic time now: a list of (action, count), count 0 meaning to the wall"""
+        repeats = []
+        # Only the most recently pressed direction auto-shifts
+        if self.shift_order:
+            action = self.shift_order[-1]
+            due = self.held[action]
+            if now >= due:
+                if self.arr <= 0:
+                    repeats.append((action, 0))
+                    self.held[action] = now
+                else:
+                    count = int((now - due) // self.arr) + 1
+                    repeats.append((action, count))
+                    self.held[action] = due + count * self.arr
+        due = self.held.get("down")
+        if due is not None and now >= due:
+            count = int((now - due) // self.soft_drop) + 1 if self.soft_drop > 0 else 1
+            repeats.append(("down", count))
+            self.held["down"] = due + count * max(self.soft_drop, 1)
+        return repeats
+
+    def presented(self):
+        """Call once a frame is on screen: closes out the latency of the presses it shows"""
+        now = time.perf_counter()
+        while self.pending:
+            arrived, dequeued = self.pending.popleft()
+            self.latencies.append((now - arrived) * 1000)
+            self.dequeue_latencies.append((now - dequeued) * 1000)
+
+    def latency_stats(self):
+        """(mean, max) input-to-present latency in ms over recent presses, an upper bound"""
+        return self._stats(self.latencies)
+
+    def dequeue_stats(self):
+        """(mean, max) ms from taking a key off the queue to presenting its move"""
+        return self._stats(self.dequeue_latencies)
+
+    def _stats(self, latencies):
+        if not latencies:
+            return 0.0, 0.0
+        return sum(latencies) / len(latencies), max(latencies)
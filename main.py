@@ -1,28 +1,99 @@
+import importlib
 import sys
-from PySide6.QtWidgets import QApplication
-from login import LoginWindow
-from main_menu import MainMenu
-from game_controller import GameController
+import time
 
-def run_app():
-    app = QApplication(sys.argv)
+STARTED = time.perf_counter()
+
+# Heavy modules that should only load once a game or a secondary window is opened
+DEFERRED_MODULES = ("pygame", "pymysql", "numpy", "game_controller", "main_menu", "settings", "high_scores")
+
+
+def report_startup(steps):
+    """Print the import and init time of each startup step, and any deferred module loaded early"""
+    print(f"{'step':<28}{'ms':>10}")
+    for name, duration in steps:
+        print(f"{name:<28}{duration:>10.1f}")
+    print(f"{'login window visible':<28}{(time.perf_counter() - STARTED) * 1000:>10.1f}")
+    loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+    print(f"deferred modules loaded: {', '.join(loaded) or 'none'}")
+
+
+def run_app(profile_startup=False, embedded=False, profile_path=None):
+    steps = []
+
+    def timed(name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        steps.append((name, (time.perf_counter() - start) * 1000))
+        return result
+
+    qt_widgets = timed("import PySide6.QtWidgets", importlib.import_module, "PySide6.QtWidgets")
+    qt_core = timed("import PySide6.QtCore", importlib.import_module, "PySide6.QtCore")
+    login = timed("import login", importlib.import_module, "login")
+    app = timed("QApplication", qt_widgets.QApplication, sys.argv)
+    login_window = timed("LoginWindow", login.LoginWindow)
+    game_processes = []  # One per game window; each keeps its game session between games
+
+    def close_games():
+        for game_process in game_processes:
+            game_process.close()
+
+    app.aboutToQuit.connect(close_games)
 
-    login_window = LoginWindow()
     def on_login_success(username):
+        from main_menu import MainMenu
         main_menu = MainMenu(username)
 
+        def on_start_game_embedded(speed, difficulty_name, username):
+            # The game takes the menu's place in a Qt window until the player leaves it
+            from game_widget import GameWidget
+            game_widget = GameWidget(speed, difficulty_name, username, profile_path=profile_path)
+            game_widget.setWindowTitle(main_menu.windowTitle())
+
+            def on_finished():
+                game_widget.close()
+                game_widget.deleteLater()
+                main_menu.show()
+
+            game_widget.finished.connect(on_finished)
+            main_menu.hide()
+            game_widget.show()
+            game_widget.start()
+
         def on_start_game(speed, difficulty_name, username):
-            controller = GameController(speed=speed, difficulty_name=difficulty_name, username=username)
-            controller.start_game()
+            # Games run in child processes, so pygame never loads here and the menu stays live
+            from game_process import GameProcess
+            idle = [game_process for game_process in game_processes if not game_process.playing]
+            if idle:
+                game_process = idle[0]
+            else:
+                game_process = GameProcess(app, profile_path)
+                game_processes.append(game_process)
+            game_process.start_game(speed, difficulty_name, username)
 
-        main_menu.start_game_signal.connect(on_start_game)
+        main_menu.start_game_signal.connect(on_start_game_embedded if embedded else on_start_game)
         main_menu.show()
 
 
     login_window.login_successful.connect(on_login_success)
 
-    login_window.show()
+    timed("show", login_window.show)
+    if profile_startup:
+        # Fires on the first pass of the event loop, once the window is up
+        qt_core.QTimer.singleShot(0, lambda: report_startup(steps))
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    run_app()
+    profile_startup = "--profile-startup" in sys.argv
+    if profile_startup:
+        sys.argv.remove("--profile-startup")
+    embedded = "--embedded" in sys.argv
+    if embedded:
+        sys.argv.remove("--embedded")
+    profile_path = None
+    if "--profile-frames" in sys.argv:
+        # --profile-frames FILE: log every game frame's timings to FILE (.csv or JSON lines)
+        index = sys.argv.index("--profile-frames")
+        profile_path = sys.argv[index + 1] if index + 1 < len(sys.argv) else None
+        del sys.argv[index:index + 2]
+    run_app(profile_startup, embedded, profile_path)
@@ -186,8 +186,9 @@ class MainMenu(QWidget):
 
     def start_game_with_level(self, speed, difficulty_name):
         """Start game with selected difficulty"""
+        # The game runs in its own window and process; the menu stays usable meanwhile
         self.start_game_signal.emit(speed, difficulty_name, self.username)
-        self.close()
+        self.show_main_menu()
 
     def show_high_scores(self):
         """Open high scores window"""
@@ -1,4 +1,3 @@
-class Position:
-	def __init__(self, row, column):
-		self.row = row
-		self.column = column
+from collections import namedtuple
+
+Position = namedtuple("Position", ["row", "column"])
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import random
+import time
+from game_model import GameModel
+from game_view import GameView
+
+SCENARIOS = ("empty", "half-full", "near-top-out", "paused", "game-over")
+
+
+def fill_rows(model, rows, rng):
+    """Fill the bottom rows of the board with junk, one hole per row so nothing clears"""
+    grid = model.grid
+    for row in range(grid.num_rows - rows, grid.num_rows):
+        hole = rng.randrange(grid.num_cols)
+        for column in range(grid.num_cols):
+            if column != hole:
+                grid.set_cell(row, column, rng.randint(1, 7))
+
+
+def build_scenario(name, seed=0):
+    """A model holding one of the scripted board states"""
+    rng = random.Random(seed)
+    model = GameModel(save_scores=False, seed=seed)
+    if name == "half-full":
+        fill_rows(model, model.grid.num_rows // 2, rng)
+    elif name in ("near-top-out", "paused", "game-over"):
+        fill_rows(model, model.grid.num_rows - 3, rng)
+    model.score = 123450
+    model.paused = name == "paused"
+    model.game_over = name == "game-over"
+    return model
+
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def run_scenario(view, name, frames, seed=0, full=False):
+    """Draw frames of a scenario, sliding the piece back and forth between frames.
+
+    The first, full frame is timed on its own. The pause and game over screens
+    are static and render() skips them once drawn, so those scenarios repaint
+    the whole screen every frame, as after an expose."""
+    model = build_scenario(name, seed)
+    static = model.paused or model.game_over
+    view.invalidate()
+    t0 = time.perf_counter()
+    view.draw(model)
+    first_frame_time = time.perf_counter() - t0
+
+    render_times = []
+    present_times = []
+    start = time.perf_counter()
+    for frame in range(frames):
+        if not static:
+            model.apply_action("left" if frame % 8 < 4 else "right")
+        if full or static:
+            view.invalidate()
+        t0 = time.perf_counter()
+        view.render(model)
+        t1 = time.perf_counter()
+        view.present()
+        present_times.append(time.perf_counter() - t1)
+        render_times.append(t1 - t0)
+    wall_time = time.perf_counter() - start
+
+    render_times.sort()
+    last = len(render_times) - 1
+    return {
+        "scenario": name,
+        "frames": frames,
+        "first_frame_ms": first_frame_time * 1000,
+        "fps": frames / wall_time if wall_time else 0,
+        "render_mean_ms": sum(render_times) / frames * 1000,
+        "render_p50_ms": render_times[last // 2] * 1000,
+        "render_p99_ms": render_times[int(last * 0.99)] * 1000,
+        "present_mean_ms": sum(present_times) / frames * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameView rendering on scripted board states")
+    parser.add_argument("--frames", type=positive_int, default=1000)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="scenario to run, may be repeated (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--full", action="store_true", help="repaint the whole window every frame")
+    parser.add_argument("--display", action="store_true",
+                        help="render to a real window instead of an offscreen surface")
+    parser.add_argument("--bevel", action="store_true", help="use bevelled tiles")
+    args = parser.parse_args()
+
+    if not args.display:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    view = GameView(bevel=args.bevel, offscreen=not args.display)
+    try:
+        for name in args.scenario or SCENARIOS:
+            print(json.dumps(run_scenario(view, name, args.frames, args.seed, args.full)))
+    finally:
+        view.close()
+
+
+if __name__ == "__main__":
+    main()
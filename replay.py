@@ -0,0 +1,170 @@
+import argparse
+import os
+import struct
+import time
+from game_model import GameModel
+
+REPLAY_MAGIC = b"TRPL"
+REPLAY_VERSION = 1
+REPLAY_DIR = "replays"
+TICK_MS = 1000 / 60  # One controller frame; record frame numbers count these
+
+# magic, version, seed (signed: PieceBag takes any int), base speed (ms), difficulty name length
+HEADER = struct.Struct("<4sBqHB")
+
+# Recorded actions; each record is one varint holding (frame delta << 3) | action code
+ACTIONS = ("left", "right", "down", "rotate", "drop", "gravity")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+
+def _write_varint(buffer, value):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class ReplayRecorder:
+    """Records the actions applied to one game as a compact binary stream"""
+
+    def __init__(self, seed, difficulty, speed):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.speed = speed
+        self.data = bytearray()
+        self.last_frame = 0
+
+    def record(self, frame, action):
+        _write_varint(self.data, ((frame - self.last_frame) << 3) | ACTION_CODES[action])
+        self.last_frame = frame
+
+    def to_bytes(self):
+        difficulty = self.difficulty.encode("utf-8")
+        header = HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.speed, len(difficulty))
+        return header + difficulty + bytes(self.data)
+
+    def save(self, path=None):
+        """Write the replay, by default to replays/<timestamp>_<seed>.rpl"""
+        if path is None:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            path = os.path.join(REPLAY_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}_{self.seed}.rpl")
+        try:
+            with open(path, 'wb') as f:
+                f.write(self.to_bytes())
+        except Exception as e:
+            print(f"Error saving replay: {e}")
+            return None
+        return path
+
+
+class Replay:
+    """A decoded replay: game settings plus (frame, action) records"""
+
+    def __init__(self, seed, difficulty, speed, records):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.speed = speed
+        self.records = records
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, speed, name_length = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Not a supported replay file")
+        offset = HEADER.size
+        difficulty = data[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+
+        records = []
+        frame = 0
+        while offset < len(data):
+            value, offset = _read_varint(data, offset)
+            frame += value >> 3
+            records.append((frame, ACTIONS[value & 7]))
+        return cls(seed, difficulty, speed, records)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def _replay_model(replay):
+    model = GameModel(replay.difficulty, "Replay", save_scores=False, seed=replay.seed)
+    model.base_speed = replay.speed
+    model.current_speed = replay.speed
+    return model
+
+
+def _apply(model, action):
+    if action == "gravity":
+        model.move_down()
+    else:
+        model.apply_action(action)
+
+
+def play_replay(replay):
+    """Re-simulate a replay headlessly as fast as possible; returns the final model"""
+    model = _replay_model(replay)
+    for _, action in replay.records:
+        _apply(model, action)
+    return model
+
+
+def watch_replay(replay, speed=1.0):
+    """Show a replay in the game window, paced by its recorded frame numbers; returns the final model"""
+    import pygame
+    from game_view import GameView
+
+    model = _replay_model(replay)
+    view = GameView()
+    start = time.perf_counter()
+    try:
+        for frame, action in replay.records:
+            due = start + frame * TICK_MS / 1000 / speed
+            while time.perf_counter() < due:
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    return model
+                view.draw(model)
+                pygame.time.wait(max(0, min(int((due - time.perf_counter()) * 1000), int(TICK_MS))))
+            _apply(model, action)
+        view.draw(model)
+        pygame.time.wait(1000)
+    finally:
+        view.close()
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-simulate recorded Tetris games")
+    parser.add_argument("replays", nargs="+", help="replay files")
+    parser.add_argument("--watch", action="store_true", help="show each replay in a window at its recorded pace")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed multiplier for --watch")
+    args = parser.parse_args()
+
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        model = watch_replay(replay, args.speed) if args.watch else play_replay(replay)
+        duration = time.perf_counter() - start
+        print(f"{path}: seed={replay.seed} difficulty={replay.difficulty} score={model.score} "
+              f"level={model.level} lines={model.lines_cleared} pieces={model.pieces_placed} "
+              f"game_over={model.game_over} actions={len(replay.records)} "
+              f"frames={replay.records[-1][0] if replay.records else 0} "
+              f"replayed in {duration * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
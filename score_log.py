@@ -0,0 +1,205 @@
+import atexit
+import datetime
+import json
+import os
+import queue
+import tempfile
+import threading
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+SCORE_LOG_FILE = "scores.jsonl"
+HIGH_SCORES_FILE = "high_scores.json"
+TOP_N = 10
+
+_STOP = object()
+
+
+def atomic_write(path, text):
+    """Replace path with text so readers and crashes only ever see the old or the new file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class FileLock:
+    """Exclusive lock on a side file, shared by every process using the score files"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, 'a+')
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+        self.file = None
+
+
+def top_scores(entries, count=TOP_N):
+    # Sort by score descending, then by timestamp (older scores first for ties)
+    return sorted(entries, key=lambda x: (-x["score"], x["timestamp"]))[:count]
+
+
+class ScoreLog:
+    """Append-only JSON-lines history of every finished game.
+
+    append() only queues the entry; a background thread writes each batch
+    with a single fsync and then refreshes high_scores.json, the top-N index
+    the high scores window reads. Resets are recorded as marker lines, so
+    the index restarts empty while the full history stays in the log.
+    Several processes may share the files: each batch is appended and merged
+    into the index under a lock file, so their updates are serialized."""
+
+    def __init__(self, path=SCORE_LOG_FILE, index_path=HIGH_SCORES_FILE, top_n=TOP_N):
+        self.path = path
+        self.index_path = index_path
+        self.lock_path = path + ".lock"
+        self.top_n = top_n
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def append(self, entry):
+        """Queue a finished game for writing; never blocks on the disk"""
+        self._start()
+        self.queue.put(entry)
+
+    def reset(self):
+        """Empty the leaderboard, keeping the history"""
+        self._start()
+        self.queue.put({"type": "reset", "timestamp": datetime.datetime.now().isoformat()})
+
+    def flush(self):
+        """Wait until everything queued so far is on disk"""
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        with self.lock:
+            if self.thread is None:
+                return
+            self.queue.put(_STOP)
+            self.thread.join()
+            self.thread = None
+
+    def _start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="score-log", daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        try:
+            with FileLock(self.lock_path):
+                self.load()
+        except Exception as e:
+            print(f"Error opening score log: {e}")
+
+        while True:
+            # Everything queued by now goes out as one batch with one fsync
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP in batch
+            records = [record for record in batch if record is not _STOP]
+            try:
+                if records:
+                    with FileLock(self.lock_path):
+                        self.write_batch(records)
+            except Exception as e:
+                print(f"Error saving score: {e}")
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                break
+
+    def write_batch(self, records):
+        """Append records and fold them into the index; call with the lock held"""
+        # Opened per batch: a compaction by another process replaces the file
+        with open(self.path, 'a') as log:
+            log.write("".join(json.dumps(record) + "\n" for record in records))
+            log.flush()
+            os.fsync(log.fileno())
+
+        # The lock orders this after every earlier batch, from any process
+        scores = self.read_index()
+        for record in records:
+            if record.get("type") == "reset":
+                scores = []
+            else:
+                scores.append(record)
+        atomic_write(self.index_path, json.dumps(top_scores(scores, self.top_n), indent=4))
+
+    def read_index(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def read_records(self):
+        """Valid records in the log, and whether a damaged line was skipped"""
+        records = []
+        damaged = False
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    damaged = True  # A write cut short by a crash
+        return records, damaged
+
+    def load(self):
+        """Bring the log and the index in line before the first write; call with the lock held"""
+        if not os.path.exists(self.path):
+            # First run: the old high_scores.json becomes the start of the history
+            atomic_write(self.path, "".join(json.dumps(entry) + "\n" for entry in self.read_index()))
+            return
+
+        records, damaged = self.read_records()
+        if damaged:
+            self.compact(records)
+        if not os.path.exists(self.index_path):
+            scores = []
+            for record in records:
+                if record.get("type") == "reset":
+                    scores = []
+                else:
+                    scores.append(record)
+            atomic_write(self.index_path, json.dumps(top_scores(scores, self.top_n), indent=4))
+
+    def compact(self, records=None):
+        """Rewrite the log with only its valid records, atomically; call with the lock held"""
+        if records is None:
+            records, _ = self.read_records()
+        atomic_write(self.path, "".join(json.dumps(record) + "\n" for record in records))
+
+
+score_log = ScoreLog()
@@ -1,14 +1,12 @@
 import os
 import json
-import pygame
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QSlider, QComboBox,
     QPushButton, QMessageBox, QFrame, QHBoxLayout
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
-
-pygame.mixer.init()
+import audio
 
 CONFIG_PATH = "settings.json"
 DEFAULT_CONFIG = {
@@ -20,7 +18,12 @@ DEFAULT_CONFIG = {
         "rotate": "up",
         "drop": "space",
         "pause": "p"
-    }
+    },
+    "das": 200,
+    "arr": 100,
+    "audio_buffer": 512,
+    "fps_cap": 60,  # Render frame rate limit, 0 for uncapped
+    "profile_path": ""  # Per-frame timings log (.csv or JSON lines), empty for none
 }
 
 def load_config():
@@ -204,18 +207,15 @@ class SettingsWindow(QWidget):
         main_layout.addWidget(panel)
 
     def play_music(self, path):
-        pygame.mixer.music.stop()
-        try:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(self.config["volume"])
-            pygame.mixer.music.play(-1)
-        except pygame.error as e:
-            QMessageBox.critical(self, "Error", f"Could not play {path}:\n{e}")
+        audio.stop_music()
+        audio.set_volume(self.config["volume"])
+        if not audio.play_music(path):
+            QMessageBox.critical(self, "Error", f"Could not play {path}")
 
     def adjust_volume(self, value):
         volume = value / 100
         self.config["volume"] = volume
-        pygame.mixer.music.set_volume(volume)
+        audio.set_volume(volume)
 
     def preview_music(self):
         selected_file = self.music_selector.currentText()
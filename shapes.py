@@ -0,0 +1,43 @@
+from collections import namedtuple
+from position import Position
+
+# Cell offsets (row, column) of every piece id, one tuple per rotation state
+SHAPE_CELLS = {
+	1: (((0, 2), (1, 0), (1, 1), (1, 2)), ((0, 1), (1, 1), (2, 1), (2, 2)),
+		((1, 0), (1, 1), (1, 2), (2, 0)), ((0, 0), (0, 1), (1, 1), (2, 1))),
+	2: (((0, 0), (1, 0), (1, 1), (1, 2)), ((0, 1), (0, 2), (1, 1), (2, 1)),
+		((1, 0), (1, 1), (1, 2), (2, 2)), ((0, 1), (1, 1), (2, 0), (2, 1))),
+	3: (((1, 0), (1, 1), (1, 2), (1, 3)), ((0, 2), (1, 2), (2, 2), (3, 2)),
+		((2, 0), (2, 1), (2, 2), (2, 3)), ((0, 1), (1, 1), (2, 1), (3, 1))),
+	4: (((0, 0), (0, 1), (1, 0), (1, 1)),),
+	5: (((0, 1), (0, 2), (1, 0), (1, 1)), ((0, 1), (1, 1), (1, 2), (2, 2)),
+		((1, 1), (1, 2), (2, 0), (2, 1)), ((0, 0), (1, 0), (1, 1), (2, 1))),
+	6: (((0, 1), (1, 0), (1, 1), (1, 2)), ((0, 1), (1, 1), (1, 2), (2, 1)),
+		((1, 0), (1, 1), (1, 2), (2, 1)), ((0, 1), (1, 0), (1, 1), (2, 1))),
+	7: (((0, 0), (0, 1), (1, 1), (1, 2)), ((0, 2), (1, 1), (1, 2), (2, 1)),
+		((1, 0), (1, 1), (2, 1), (2, 2)), ((0, 1), (1, 0), (1, 1), (2, 0))),
+}
+
+PieceRotation = namedtuple("PieceRotation",
+	["cells", "row_masks", "min_row", "max_row", "min_column", "max_column", "column_bottoms"])
+
+def _build_rotation(cells):
+	"""Precompute positions, per-row bitmasks, bounding box and lowest cell per column of one rotation"""
+	row_masks = [0] * 4
+	for row, column in cells:
+		row_masks[row] |= 1 << column
+	bottoms = {}
+	for row, column in cells:
+		bottoms[column] = max(row, bottoms.get(column, row))
+	rows = [row for row, _ in cells]
+	columns = [column for _, column in cells]
+	return PieceRotation(tuple(Position(row, column) for row, column in cells), tuple(row_masks),
+		min(rows), max(rows), min(columns), max(columns), tuple(sorted(bottoms.items())))
+
+# Immutable per-(piece, rotation) tables shared by every Block instance
+ROTATIONS = {piece_id: tuple(_build_rotation(cells) for cells in rotations)
+	for piece_id, rotations in SHAPE_CELLS.items()}
+
+# Same positions keyed by rotation state, the form exposed as Block.cells
+CELLS = {piece_id: {state: rotation.cells for state, rotation in enumerate(rotations)}
+	for piece_id, rotations in ROTATIONS.items()}
@@ -0,0 +1,120 @@
+import argparse
+import importlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from game_model import GameModel
+
+TICK_MS = 1000 / 60  # One controller frame; gravity is applied on this clock
+ACTIONS = ["left", "right", "down", "rotate", "drop"]
+
+
+def random_policy(model, rng):
+    """Bot that mostly shuffles the piece around before dropping it"""
+    return rng.choice(ACTIONS + [None] * 5)
+
+
+def run_game(policy, seed, difficulty="Medium", max_pieces=1000):
+    """Play one headless game and return its result.
+
+    ``policy`` is either a bot ``policy(model, rng) -> action or None``
+    called once per frame, or a sequence of recorded per-frame actions."""
+    rng = random.Random(seed)
+    model = GameModel(difficulty, "Bot", save_scores=False, seed=seed)
+    inputs = None if callable(policy) else iter(policy)
+
+    start = time.perf_counter()
+    ticks = 0
+    elapsed_ms = 0
+    last_update = 0
+    while not model.game_over and model.pieces_placed < max_pieces:
+        action = policy(model, rng) if inputs is None else next(inputs, None)
+        if action:
+            model.apply_action(action)
+        ticks += 1
+        elapsed_ms += TICK_MS
+        if not model.game_over and elapsed_ms - last_update >= model.current_speed:
+            model.move_down()
+            last_update = elapsed_ms
+
+    return {
+        "seed": seed,
+        "score": model.score,
+        "level": model.level,
+        "lines": model.lines_cleared,
+        "pieces": model.pieces_placed,
+        "ticks": ticks,
+        "duration": time.perf_counter() - start
+    }
+
+
+def _run_chunk(policy, seeds, difficulty, max_pieces):
+    return [run_game(policy, seed, difficulty, max_pieces) for seed in seeds]
+
+
+def simulate(policy, games, seed_start=0, difficulty="Medium", max_pieces=1000, workers=None, chunk_size=4):
+    """Run ``games`` headless games (seeds seed_start..) across a process pool.
+
+    Yields each game's result as soon as its chunk finishes. The policy must
+    be picklable: a module-level function or a list of recorded actions."""
+    seeds = list(range(seed_start, seed_start + games))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, policy, seeds[i:i + chunk_size], difficulty, max_pieces)
+                   for i in range(0, len(seeds), chunk_size)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results, wall_time):
+    """Throughput figures for a finished simulation"""
+    pieces = sum(result["pieces"] for result in results)
+    return {
+        "games": len(results),
+        "wall_time": wall_time,
+        "games_per_second": len(results) / wall_time if wall_time else 0,
+        "pieces_per_second": pieces / wall_time if wall_time else 0,
+        "mean_score": sum(result["score"] for result in results) / len(results) if results else 0
+    }
+
+
+def load_policy(name):
+    """Resolve 'random' or a 'module:function' bot reference"""
+    if name == "random":
+        return random_policy
+    module_name, _, function_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Tetris games across all cores")
+    parser.add_argument("--policy", default="random", help="'random' or module:function")
+    parser.add_argument("--inputs", help="JSON file with a list of recorded per-frame actions")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="first seed of the range")
+    parser.add_argument("--difficulty", default="Medium", choices=list(GameModel.DIFFICULTY_SPEEDS))
+    parser.add_argument("--max-pieces", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args()
+
+    if args.inputs:
+        with open(args.inputs, 'r') as f:
+            policy = json.load(f)
+    else:
+        policy = load_policy(args.policy)
+
+    results = []
+    start = time.perf_counter()
+    for result in simulate(policy, args.games, args.seed, args.difficulty, args.max_pieces, args.workers):
+        results.append(result)
+        if not args.quiet:
+            print(json.dumps(result))
+    summary = summarize(results, time.perf_counter() - start)
+    summary["workers"] = args.workers
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Scripted players shared by the tests"""
+
+SHIFTS = range(-5, 6)
+
+
+def holes(grid):
+    """Empty cells under the surface of their column"""
+    count = 0
+    for column, top in enumerate(grid.column_tops):
+        for row in range(top + 1, grid.num_rows):
+            if not (grid.rows[row] >> column) & 1:
+                count += 1
+    return count
+
+
+def greedy_actions(model):
+    """Actions placing the current piece where it clears the most lines, then leaves the fewest holes
+    and the lowest stack; tries every placement through snapshot() and restore()"""
+    state = model.snapshot()
+    best_actions = ["drop"]
+    best_key = None
+    for rotations in range(4):
+        for shift in SHIFTS:
+            # One step down first: some pieces cannot rotate on their spawn row
+            actions = ["down"] + ["rotate"] * rotations + ["left" if shift < 0 else "right"] * abs(shift) + ["drop"]
+            for action in actions:
+                model.apply_action(action)
+            grid = model.grid
+            key = (not model.game_over, model.lines_cleared, -holes(grid),
+                   sum(grid.column_tops))
+            if best_key is None or key > best_key:
+                best_key = key
+                best_actions = actions
+            model.restore(state)
+    return best_actions
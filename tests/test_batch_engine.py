@@ -0,0 +1,79 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from batch_engine import BatchEngine, NOOP, LEFT, RIGHT, ROTATE, DOWN, DROP, GRAVITY
+from batch_engine import NUM_ROWS, PADDING, PLAY_MASK, WALL_BITS
+from game_model import GameModel
+
+MODEL_ACTIONS = {LEFT: "left", RIGHT: "right", ROTATE: "rotate", DOWN: "down", DROP: "drop"}
+
+
+def engine_states(engine):
+    """Comparable state of every board"""
+    # board_rows() for every board at once
+    rows = ((engine.boards[:, PADDING:PADDING + NUM_ROWS] & PLAY_MASK) >> np.uint32(WALL_BITS)).tolist()
+    placements = zip(engine.piece.tolist(), engine.rotation.tolist(), engine.row.tolist(), engine.column.tolist())
+    return [(board, game_over, score, level, lines, pieces, None if game_over else placement)
+            for board, game_over, score, level, lines, pieces, placement in
+            zip(rows, engine.game_over.tolist(), engine.score.tolist(), engine.level.tolist(),
+                engine.lines.tolist(), engine.pieces.tolist(), placements)]
+
+
+def model_state(model):
+    block = model.current_block
+    placement = (block.id, block.rotation_state, block.row_offset, block.column_offset)
+    return (model.grid.rows, model.game_over, model.score, model.level, model.lines_cleared,
+            model.pieces_placed, None if model.game_over else placement)
+
+
+class BatchEngineTest(unittest.TestCase):
+    """BatchEngine must follow GameModel step for step; the boards only share their pieces"""
+
+    def new_model(self, engine, index, seed):
+        model = GameModel(save_scores=False, seed=seed)
+        self.sync_pieces(engine, index, model)
+        block = model.current_block
+        engine.rotation[index] = block.rotation_state
+        engine.row[index] = block.row_offset
+        engine.column[index] = block.column_offset
+        return model
+
+    def sync_pieces(self, engine, index, model):
+        # The engine deals from its own bags: hand it the model's pieces instead
+        engine.piece[index] = model.current_block.id
+        engine.next_piece[index] = model.next_block.id
+
+    def test_matches_game_model(self):
+        num_games = 200
+        rng = random.Random(5)
+        engine = BatchEngine(num_games, seed=5)
+        models = [self.new_model(engine, index, rng.randrange(2 ** 32)) for index in range(num_games)]
+        choices = [NOOP, LEFT, RIGHT, ROTATE, DOWN, DROP, GRAVITY, GRAVITY, GRAVITY]
+        cleared = 0
+
+        for step in range(3000):
+            actions = [rng.choice(choices) for _ in range(num_games)]
+            engine.step(actions)
+            for model, action in zip(models, actions):
+                if action == GRAVITY:
+                    model.move_down()
+                elif action != NOOP:
+                    model.apply_action(MODEL_ACTIONS[action])
+            self.assertEqual(engine_states(engine), [model_state(model) for model in models], f"step {step}")
+
+            for index, model in enumerate(models):
+                self.sync_pieces(engine, index, model)
+                if model.game_over:
+                    cleared += model.lines_cleared
+                    engine.reset([index])
+                    models[index] = self.new_model(engine, index, rng.randrange(2 ** 32))
+        self.assertGreater(cleared, 0)  # Line clears and scoring were exercised too
+
+
+if __name__ == "__main__":
+    unittest.main()
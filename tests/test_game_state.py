@@ -0,0 +1,63 @@
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_model import GameModel
+from players import greedy_actions
+
+
+def play_pieces(model, count):
+    """Place count pieces with the greedy player; returns the actions applied"""
+    applied = []
+    for _ in range(count):
+        if model.game_over:
+            break
+        for action in greedy_actions(model):
+            model.apply_action(action)
+            applied.append(action)
+    return applied
+
+
+class GameStateTest(unittest.TestCase):
+    def test_restore_resumes_the_same_game(self):
+        model = GameModel(save_scores=False, seed=9)
+        for _ in range(6):
+            play_pieces(model, 5)
+            state = model.snapshot()
+            actions = play_pieces(model, 10)
+            after = model.snapshot()
+
+            model.restore(state)
+            self.assertEqual(model.snapshot(), state)
+            for action in actions:
+                model.apply_action(action)
+            self.assertEqual(model.snapshot(), after)
+        self.assertGreater(model.lines_cleared, 0)
+
+    def test_restore_into_another_model(self):
+        model = GameModel(save_scores=False, seed=21)
+        play_pieces(model, 15)
+        state = model.snapshot()
+        actions = play_pieces(model, 15)
+
+        other = GameModel(save_scores=False, seed=22)
+        other.restore(state)
+        for action in actions:
+            other.apply_action(action)
+        self.assertEqual(other.snapshot(), model.snapshot())
+        self.assertEqual(other.preview(5), model.preview(5))  # The bag carries on the same way
+
+    def test_snapshot_is_not_changed_by_play(self):
+        model = GameModel(save_scores=False, seed=4)
+        play_pieces(model, 10)
+        state = model.snapshot()
+        saved = copy.deepcopy(state)
+        play_pieces(model, 20)
+        self.assertEqual(state, saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid import BitboardGrid
+from game_model import GameModel
+from zobrist import CELL_KEYS
+from players import greedy_actions
+
+
+def recomputed(grid):
+    """Row masks, column tops and hash rebuilt cell by cell from the color rows"""
+    rows = [sum(1 << column for column, value in enumerate(colors) if value) for colors in grid.grid]
+    tops = [next((row for row in range(grid.num_rows) if (rows[row] >> column) & 1), grid.num_rows)
+            for column in range(grid.num_cols)]
+    board_hash = 0
+    for row, mask in enumerate(rows):
+        for column in range(grid.num_cols):
+            if (mask >> column) & 1:
+                board_hash ^= CELL_KEYS[row][column]
+    return rows, tops, board_hash
+
+
+class BitboardGridTest(unittest.TestCase):
+    def assert_consistent(self, grid, message=None):
+        self.assertEqual((grid.rows, grid.column_tops, grid.hash), recomputed(grid), message)
+
+    def test_random_cell_writes(self):
+        rng = random.Random(10)
+        grid = BitboardGrid()
+        for write in range(5000):
+            value = rng.randint(1, 7) if rng.random() < 0.6 else 0
+            grid.set_cell(rng.randrange(grid.num_rows), rng.randrange(grid.num_cols), value)
+            self.assert_consistent(grid, f"write {write}")
+            if write % 500 == 499:
+                grid.clear_full_rows()
+                self.assert_consistent(grid, f"clear after write {write}")
+
+    def test_every_move_of_a_game(self):
+        rng = random.Random(3)
+        for seed in range(3):
+            model = GameModel(save_scores=False, seed=seed)
+            while not model.game_over and model.pieces_placed < 80:
+                for action in greedy_actions(model):
+                    if rng.random() < 0.2:
+                        model.move_down()
+                        self.assert_consistent(model.grid)
+                    model.apply_action(action)
+                    self.assert_consistent(model.grid, f"seed {seed}, piece {model.pieces_placed}")
+            self.assertGreater(model.lines_cleared, 0)
+
+    def test_restore_keeps_hash(self):
+        model = GameModel(save_scores=False, seed=8)
+        states = []
+        while not model.game_over and model.pieces_placed < 40:
+            states.append((model.snapshot(), model.grid.hash))
+            for action in greedy_actions(model):
+                model.apply_action(action)
+        for state, board_hash in states:
+            model.restore(state)
+            self.assertEqual(model.grid.hash, board_hash)
+            self.assert_consistent(model.grid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_model import GameModel
+from replay import Replay, ReplayRecorder, play_replay
+from players import greedy_actions
+
+
+def record_game(seed, difficulty="Medium", pieces=60, rng_seed=0):
+    """Play a game the way GameController records it; returns the model, its recording and the actions"""
+    rng = random.Random(rng_seed)
+    model = GameModel(difficulty, save_scores=False, seed=seed)
+    recorder = ReplayRecorder(model.seed, difficulty, model.base_speed)
+    frame = 0
+    records = []
+    while not model.game_over and model.pieces_placed < pieces:
+        placed = model.pieces_placed
+        for planned in greedy_actions(model):
+            # Gravity steps land between the player's moves
+            for action in ("gravity", planned) if rng.random() < 0.3 else (planned,):
+                if model.pieces_placed != placed:
+                    break  # Gravity locked the piece early
+                frame += rng.choice((0, 1, 1, 2, 30, 200))  # Several actions a frame up to long idle gaps
+                recorder.record(frame, action)
+                records.append((frame, action))
+                if action == "gravity":
+                    model.move_down()
+                else:
+                    model.apply_action(action)
+    return model, recorder, records
+
+
+class ReplayTest(unittest.TestCase):
+    def test_replays_resimulate_to_the_same_game(self):
+        for game in range(20):
+            model, recorder, _ = record_game(seed=1000 + game, rng_seed=game)
+            replay = Replay.from_bytes(recorder.to_bytes())
+            self.assertEqual(play_replay(replay).snapshot(), model.snapshot(), f"game {game}")
+
+    def test_header_and_frames_round_trip(self):
+        model, recorder, records = record_game(seed=-12345, difficulty="Hard", pieces=20)
+        with tempfile.TemporaryDirectory() as directory:
+            path = recorder.save(os.path.join(directory, "game.rpl"))
+            replay = Replay.load(path)
+        self.assertEqual((replay.seed, replay.difficulty, replay.speed), (-12345, "Hard", model.base_speed))
+        self.assertEqual(replay.records, records)
+        self.assertEqual(play_replay(replay).snapshot(), model.snapshot())
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b"NOPE" + bytes(20))
+
+
+if __name__ == "__main__":
+    unittest.main()
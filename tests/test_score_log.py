@@ -0,0 +1,96 @@
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from score_log import ScoreLog
+
+
+def entry(score, timestamp="2025-01-01T00:00:00"):
+    return {"player": "Guest", "score": score, "difficulty": "Medium", "timestamp": timestamp}
+
+
+def append_scores(path, index_path, start, count):
+    log = ScoreLog(path, index_path)
+    for score in range(start, start + count):
+        log.append(entry(score))
+    log.close()
+
+
+class ScoreLogTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "scores.jsonl")
+        self.index_path = os.path.join(self.directory.name, "high_scores.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_log(self):
+        with open(self.path, 'r') as f:
+            return [json.loads(line) for line in f]
+
+    def read_index(self):
+        with open(self.index_path, 'r') as f:
+            return json.load(f)
+
+    def test_migrates_legacy_high_scores(self):
+        with open(self.index_path, 'w') as f:
+            json.dump([entry(300), entry(100)], f)
+        log = ScoreLog(self.path, self.index_path)
+        log.append(entry(200))
+        log.close()
+        self.assertEqual([record["score"] for record in self.read_log()], [300, 100, 200])
+        self.assertEqual([record["score"] for record in self.read_index()], [300, 200, 100])
+
+    def test_keeps_history_beyond_top_n(self):
+        log = ScoreLog(self.path, self.index_path, top_n=3)
+        for score in range(10):
+            log.append(entry(score))
+        log.close()
+        self.assertEqual(len(self.read_log()), 10)
+        self.assertEqual([record["score"] for record in self.read_index()], [9, 8, 7])
+
+    def test_reset_empties_index_and_keeps_history(self):
+        log = ScoreLog(self.path, self.index_path)
+        log.append(entry(500))
+        log.flush()
+        log.reset()
+        log.flush()
+        self.assertEqual(self.read_index(), [])
+        log.append(entry(50))
+        log.close()
+        records = self.read_log()
+        self.assertEqual([record.get("type") for record in records], [None, "reset", None])
+        self.assertEqual([record["score"] for record in self.read_index()], [50])
+
+    def test_recovers_from_damaged_line(self):
+        with open(self.path, 'w') as f:
+            f.write(json.dumps(entry(400)) + "\n")
+            f.write('{"player": "Guest", "sco')  # A write cut short by a crash
+        log = ScoreLog(self.path, self.index_path)
+        log.append(entry(10))
+        log.close()
+        self.assertEqual([record["score"] for record in self.read_log()], [400, 10])
+        # The index was missing, so it is rebuilt from the log
+        self.assertEqual([record["score"] for record in self.read_index()], [400, 10])
+
+    def test_processes_share_files(self):
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=append_scores, args=(self.path, self.index_path, i * 100, 100))
+                     for i in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertEqual(len(self.read_log()), 300)
+        self.assertEqual([record["score"] for record in self.read_index()], list(range(299, 289, -1)))
+        self.assertEqual([name for name in os.listdir(self.directory.name) if name.endswith(".tmp")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
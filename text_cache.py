@@ -0,0 +1,52 @@
+import pygame
+from collections import OrderedDict
+
+# Shared fonts keyed by (name, size, system); system fonts are looked up once
+_fonts = {}
+
+
+def get_font(name, size, system=False):
+    """Shared pygame font; name None is pygame's default font"""
+    key = (name, size, system)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size) if system else pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, font, size, color)"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+
+    def render(self, text, name, size, color, system=False):
+        key = (text, name, size, color, system)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = get_font(name, size, system).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(text, name, size, color, system=False):
+    """Rendered text surface from the shared cache"""
+    return text_cache.render(text, name, size, color, system)
+
+
+def clear():
+    """Forget all fonts and surfaces, e.g. before pygame.quit() invalidates them"""
+    _fonts.clear()
+    text_cache.clear()
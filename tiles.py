@@ -0,0 +1,53 @@
+import pygame
+from colors import Colors
+
+
+class TileAtlas:
+    """One pre-rendered cell Surface per color id from Colors.get_cell_colors()"""
+
+    def __init__(self, cell_size=30, colors=None, bevel=False):
+        self.cell_size = cell_size
+        self.bevel = bevel
+        self.tiles = [self._render_tile(color) for color in (colors or Colors.get_cell_colors())]
+
+    def _render_tile(self, color):
+        size = self.cell_size - 1
+        tile = pygame.Surface((size, size))
+        tile.fill(color)
+        if self.bevel:
+            light = tuple(min(255, c + 60) for c in color)
+            dark = tuple(c // 2 for c in color)
+            pygame.draw.line(tile, light, (0, 0), (size - 1, 0), 2)
+            pygame.draw.line(tile, light, (0, 0), (0, size - 1), 2)
+            pygame.draw.line(tile, dark, (0, size - 1), (size - 1, size - 1), 2)
+            pygame.draw.line(tile, dark, (size - 1, 0), (size - 1, size - 1), 2)
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        return tile
+
+    def __getitem__(self, color_id):
+        return self.tiles[color_id]
+
+
+_atlases = {}
+
+
+def get_tile_atlas(cell_size=30, bevel=False):
+    """Shared atlas for a cell size and style"""
+    key = (cell_size, bevel)
+    if key not in _atlases:
+        _atlases[key] = TileAtlas(cell_size, bevel=bevel)
+    return _atlases[key]
+
+
+def blit_tiles(surface, pairs):
+    """Blit a sequence of (tile, position) pairs in one call"""
+    if hasattr(surface, "fblits"):
+        surface.fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
+
+
+def clear():
+    """Drop cached atlases, e.g. when the display is recreated"""
+    _atlases.clear()
@@ -0,0 +1,80 @@
+import random
+from collections import OrderedDict
+
+NUM_ROWS = 20
+NUM_COLS = 10
+
+# Fixed seed so hashes agree across runs and worker processes
+_rng = random.Random(0x7E7215)
+
+# Key of every filled (row, column) cell; a board hash XORs the keys of its filled cells
+CELL_KEYS = [[_rng.getrandbits(64) for _ in range(NUM_COLS)] for _ in range(NUM_ROWS)]
+
+# Key of every piece id, mixed into board hashes to key positions
+PIECE_KEYS = [_rng.getrandbits(64) for _ in range(8)]
+
+
+def _build_row_keys(columns):
+    """Hash of every possible mask of a 5-column half row, for every row"""
+    tables = []
+    for row in range(NUM_ROWS):
+        table = []
+        for mask in range(32):
+            key = 0
+            for bit in range(5):
+                if mask >> bit & 1:
+                    key ^= CELL_KEYS[row][columns[bit]]
+            table.append(key)
+        tables.append(table)
+    return tables
+
+
+ROW_KEYS_LOW = _build_row_keys(range(0, 5))
+ROW_KEYS_HIGH = _build_row_keys(range(5, 10))
+
+
+def row_hash(row, mask):
+    """Hash contribution of a whole row given its occupancy mask"""
+    return ROW_KEYS_LOW[row][mask & 0x1F] ^ ROW_KEYS_HIGH[row][mask >> 5]
+
+
+def position_key(board_hash, piece_id):
+    """Transposition key for a board with a given piece to place"""
+    return board_hash ^ PIECE_KEYS[piece_id]
+
+
+class TranspositionCache:
+    """Bounded LRU cache of evaluated positions"""
+
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)